@@ -12,12 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import calendar
 import datetime
-import holidays
+import importlib
+import importlib.util
+import json
+import marshal
+import math
+import os
 import pytz
 import re
+import threading
 import time
-from astral import Astral
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict, deque, namedtuple
+from functools import lru_cache, wraps
 
 import mycroft.audio
 from adapt.intent import IntentBuilder
@@ -29,6 +39,100 @@ from mycroft.util.parse import (extract_datetime, fuzzy_match, extract_number,
 from mycroft.util.time import now_utc, to_local, now_local
 from mycroft.skills.core import resting_screen_handler
 
+# Number of resolved locations remembered by get_timezone() and for how
+# long (in seconds) each resolution stays valid
+TIMEZONE_CACHE_SIZE = 64
+TIMEZONE_CACHE_TTL = 3600
+
+# Number of timezones with precomputed UTC offsets, and the span of time
+# each precomputed table covers
+OFFSET_TABLE_COUNT = 16
+OFFSET_TABLE_SPAN = datetime.timedelta(days=731)
+
+# Number of latency samples kept per stage, and how often (in seconds) the
+# latency summary is logged while stage metrics are enabled
+STAGE_SAMPLES = 1000
+STAGE_LOG_INTERVAL = 3600
+
+# Number of days whose date renderings are kept
+DAY_STRINGS_CACHE_SIZE = 8
+
+# Number of (location, date) sun event tables kept
+SOLAR_EVENTS_CACHE_SIZE = 32
+
+# File caching the city to timezone table between skill loads
+CITY_TIMEZONES_FILE = "city_timezones.json"
+
+# Number of (country, year) holiday tables kept in memory
+HOLIDAY_CACHE_SIZE = 8
+
+# File holding the parsed resources of a language between skill loads, the
+# version of its layout, how often (in seconds) the resource files are
+# checked for changes, and the (resource, directory) files it is built from
+RESOURCE_BUNDLE_FILE = "resources.{}.bundle"
+RESOURCE_BUNDLE_VERSION = 3
+RESOURCE_CHECK_INTERVAL = 5
+RESOURCE_BUNDLE_SOURCES = (("timezone.value", "dialog"),
+                           ("location.rx", "regex"),
+                           ("solar.event.value", "dialog"))
+
+# Number of years, starting with the current one, the holiday countdown
+# covers, and number of upcoming holidays it reads out
+COUNTDOWN_YEARS = 2
+COUNTDOWN_SPOKEN = 3
+
+# Caches shared by the skill's threads, each guarded by its own lock
+CACHES = ("astral", "timezone index", "city timezones", "resource bundle",
+          "timezones", "offset tables", "day strings", "solar events",
+          "countdown")
+
+# Seconds the cache warm-up waits before starting, so intent registration
+# goes first, and between its steps, so queries don't wait on it
+WARMUP_DELAY = 1.0
+WARMUP_PAUSE = 0.05
+
+
+# Time taken by the first import of each dependency loaded on first use
+IMPORT_TIMES = OrderedDict()
+
+
+def import_on_use(name):
+    """Import a heavy dependency when it is first needed.
+
+    Skill load time matters on slow devices and most sessions never need
+    e.g. the holiday tables, so these modules are imported on first use.
+    The duration of the first import is recorded in IMPORT_TIMES.
+    """
+    start = time.monotonic()
+    module = importlib.import_module(name)
+    IMPORT_TIMES.setdefault(name, time.monotonic() - start)
+    return module
+
+
+# Everything the clock displays for one moment, rendered once and shared
+# by the GUI pages and the faceplate
+ClockSnapshot = namedtuple("ClockSnapshot",
+                           ["datetime", "time_string", "date_string",
+                            "weekday_string", "month_string", "year_string"])
+
+
+# Renderings of a date, which only change at local midnight
+DayStrings = namedtuple("DayStrings",
+                        ["date_string", "weekday_string", "month_string",
+                         "year_string", "spoken_date"])
+
+
+# Times of the sun events of a day at a location, None for events that
+# don't happen that day
+SolarEvents = namedtuple("SolarEvents",
+                         ["dawn", "sunrise", "noon", "sunset", "dusk"])
+
+
+# Local time of one location in a world clock
+WorldClockEntry = namedtuple("WorldClockEntry",
+                             ["location", "datetime", "display_time",
+                              "spoken_time"])
+
 
 def speakable_timezone(tz):
     """Convert timezone to a better speakable version
@@ -47,27 +151,858 @@ def speakable_timezone(tz):
     return " ".join(say)
 
 
+def normalize_city_name(locale):
+    """Normalize a location name the way the Astral city database does.
+
+    Lowercases, joins words with underscores and strips quotes around the
+    city and the optional ",region" part.
+    """
+    key = str(locale).lower().replace(" ", "_")
+    name, _, region = key.partition(",")
+    if region:
+        return name.strip("\"'") + "," + region.strip("\"'")
+    return name.strip("\"'")
+
+
+def build_city_timezones(astral):
+    """Build a table of the names the builtin lookups understand.
+
+    Names map to timezone names, in order of precedence:
+        Astral cities, e.g. "Dallas" or "Abu Dhabi,United Arab Emirates"
+        pytz timezones, e.g. "America/Los_Angeles"
+        speakable pytz timezones, e.g. "Los Angeles America"
+
+    Arguments:
+        astral (Astral): city database
+
+    Returns:
+        dict: normalized name to timezone name
+    """
+    table = {}
+    for group in astral.geocoder.groups.values():
+        for name, locations in group.items():
+            for location in locations:
+                if location.timezone not in pytz.all_timezones_set:
+                    continue
+                table.setdefault(name, location.timezone)
+                region = normalize_city_name(location.region)
+                table.setdefault(name + "," + region, location.timezone)
+    for zone in pytz.all_timezones:
+        table.setdefault(normalize_city_name(zone), zone)
+    for zone in pytz.all_timezones:
+        table.setdefault(normalize_city_name(speakable_timezone(zone)), zone)
+    return table
+
+
+def get_library_versions():
+    """Identify the installed timezone libraries, without importing them."""
+    astral_file = importlib.util.find_spec("astral").origin
+    return {"pytz": pytz.__version__,
+            "astral": [os.path.getsize(astral_file),
+                       os.path.getmtime(astral_file)]}
+
+
+def get_file_signatures(filenames):
+    """Get the size and modification time of files.
+
+    Raises:
+        OSError: a file doesn't exist anymore
+    """
+    signatures = {}
+    for filename in filenames:
+        stat = os.stat(filename)
+        signatures[filename] = [stat.st_size, stat.st_mtime_ns]
+    return signatures
+
+
+def build_holiday_table(country, year):
+    """Get the holidays of a country across all of its states for a year.
+
+    Args:
+        country (str): name of the country class in the holidays package
+        year (int): year to get the holidays for
+
+    Returns:
+        OrderedDict: holiday name, lowercased and without " Day" (the form
+                     matched against utterances), to the date of the holiday
+    """
+    country_holidays = getattr(import_on_use("holidays"), country)
+    table = OrderedDict()
+    for st in country_holidays.STATES:
+        holiday_dict = country_holidays(years=[year], state=st)
+        for d, name in holiday_dict.items():
+            table.setdefault(name.replace(" Day", "").lower(), d)
+    return table
+
+
+@lru_cache(maxsize=HOLIDAY_CACHE_SIZE)
+def get_holiday_table(country, year):
+    """Cached build_holiday_table()."""
+    return build_holiday_table(country, year)
+
+
+@lru_cache(maxsize=HOLIDAY_CACHE_SIZE)
+def get_holiday_finder(country, year):
+    """Compile a search for the holiday names of a year.
+
+    A name can be part of another one, e.g. "christmas" of "christmas
+    eve", and the name first in the holiday table wins.  The lookahead
+    finds, at each position of an utterance, the first name in table order
+    starting there, so the winner is the found name with the lowest rank.
+
+    Args:
+        country (str): name of the country class in the holidays package
+        year (int): year to get the holidays for
+
+    Returns:
+        (re.Pattern, dict): pattern whose group 1 is a name found, and the
+                            rank of each name in the holiday table
+    """
+    names = list(get_holiday_table(country, year))
+    pattern = re.compile("(?=({}))".format(
+        "|".join(re.escape(name) for name in names)))
+    return pattern, {name: rank for rank, name in enumerate(names)}
+
+
+@lru_cache(maxsize=HOLIDAY_CACHE_SIZE)
+def get_holiday_matcher(country, year):
+    """Compile a quick check for utterances that could name a holiday.
+
+    A holiday only matches when its whole name appears in the utterance,
+    so an utterance that doesn't contain the longest word of any holiday
+    name can't match one.  Those words are combined into a single regular
+    expression.
+
+    Args:
+        country (str): name of the country class in the holidays package
+        year (int): year to get the holidays for
+
+    Returns:
+        re.Pattern: finds a holiday keyword anywhere in an utterance
+    """
+    keywords = set(max(name.split(), key=len)
+                   for name in get_holiday_table(country, year))
+    keywords = sorted(keywords, key=len, reverse=True)
+    return re.compile("|".join(re.escape(k) for k in keywords))
+
+
+@lru_cache(maxsize=HOLIDAY_CACHE_SIZE)
+def get_national_holidays(country, year):
+    """Get the holidays a whole country observes in a year.
+
+    Args:
+        country (str): name of the country class in the holidays package
+        year (int): year to get the holidays for
+
+    Returns:
+        list: (date, name) of each holiday, by date.  The "(Observed)"
+              days off of holidays falling on a weekend are left out.
+    """
+    country_holidays = getattr(import_on_use("holidays"), country)
+    return sorted((d, name) for d, name
+                  in country_holidays(years=[year]).items()
+                  if not name.endswith("(Observed)"))
+
+
+@lru_cache(maxsize=1)
+def get_leap_years():
+    """Get an array of the leap years up to datetime.MAXYEAR."""
+    return array("l", (year for year in range(1, datetime.MAXYEAR + 1)
+                       if calendar.isleap(year)))
+
+
+class CountdownTable:
+    """Days of the holidays and leap days of a range of years.
+
+    The days are kept as a sorted array of proleptic Gregorian ordinals,
+    so the next occurrence of every event and the number of days until
+    each one take a binary search and one subtraction per event.
+    """
+
+    LEAP_DAY = "Leap Day"
+
+    def __init__(self, country, first_year, last_year):
+        self.first_year = first_year
+        self.last_year = last_year
+        events = []
+        for year in range(first_year, last_year + 1):
+            events.extend((d.toordinal(), name) for d, name
+                          in get_national_holidays(country, year))
+        leap_years = get_leap_years()
+        for year in leap_years[bisect_left(leap_years, first_year):
+                               bisect_right(leap_years, last_year)]:
+            events.append((datetime.date(year, 2, 29).toordinal(),
+                           self.LEAP_DAY))
+        events.sort()
+        self.ordinals = array("l", (ordinal for ordinal, _ in events))
+        self.names = [name for _, name in events]
+
+    def upcoming(self, day):
+        """Get the next occurrence of each event, from a day on.
+
+        Arguments:
+            day (date or datetime): first day to include
+
+        Returns:
+            list: (name, date, days from day) by date, one per event
+        """
+        start = day.toordinal()
+        first = bisect_left(self.ordinals, start)
+        seen = set()
+        upcoming = []
+        for ordinal, name in zip(self.ordinals[first:], self.names[first:]):
+            if name not in seen:
+                seen.add(name)
+                upcoming.append((name, datetime.date.fromordinal(ordinal),
+                                 ordinal - start))
+        return upcoming
+
+    @staticmethod
+    def next_leap_year(year):
+        """Get the first leap year after a year."""
+        leap_years = get_leap_years()
+        index = bisect_right(leap_years, year)
+        if index < len(leap_years):
+            return leap_years[index]
+        year += 1
+        while not calendar.isleap(year):
+            year += 1
+        return year
+
+
+# Map characters to the display encoding for a Mark 1
+# (4x8 except colon, which is 2x8)
+MARK1_GLYPHS = {
+    ':': 'CIICAA',
+    '0': 'EIMHEEMHAA',
+    '1': 'EIIEMHAEAA',
+    '2': 'EIEHEFMFAA',
+    '3': 'EIEFEFMHAA',
+    '4': 'EIMBABMHAA',
+    '5': 'EIMFEFEHAA',
+    '6': 'EIMHEFEHAA',
+    '7': 'EIEAEAMHAA',
+    '8': 'EIMHEFMHAA',
+    '9': 'EIMBEBMHAA',
+}
+
+MARK1_WIDTH = 32
+
+
+def decode_mark1_image(img_code):
+    """Decode a Mark 1 image code to a list of 8 pixel column values.
+
+    The code starts with the width and height, followed by two characters
+    per column holding the low and high 4 bits of the column.
+    """
+    width = ord(img_code[0]) - ord('A')
+    return [(ord(img_code[2 + 2 * x]) - ord('A')) |
+            (ord(img_code[3 + 2 * x]) - ord('A')) << 4
+            for x in range(width)]
+
+
+def encode_mark1_image(columns):
+    """Encode 8 pixel column values as a Mark 1 image code."""
+    img_code = chr(ord('A') + len(columns)) + 'I'
+    for column in columns:
+        img_code += chr(ord('A') + (column & 0xF))
+        img_code += chr(ord('A') + (column >> 4))
+    return img_code
+
+
+@lru_cache(maxsize=4)
+def render_mark1_frame(display_time, alarm_set):
+    """Compose the whole Mark 1 faceplate for a time.
+
+    Arguments:
+        display_time (str): time to show, e.g. "12:34"
+        alarm_set (bool): show a dot in the upper right for active alarms
+
+    Returns:
+        tuple: the value of each pixel column of the faceplate
+    """
+    frame = [0] * MARK1_WIDTH
+    # draw the time, centered on display
+    xoffset = (MARK1_WIDTH - (4 * len(display_time) - 2)) // 2
+    for c in display_time:
+        if c in MARK1_GLYPHS:
+            glyph = decode_mark1_image(MARK1_GLYPHS[c])
+            frame[xoffset:xoffset + len(glyph)] = glyph
+            xoffset += len(glyph)  # glyphs include a trailing space
+    if alarm_set:
+        frame[30] = 0x02
+    return tuple(frame[:MARK1_WIDTH])
+
+
+class TimezoneIndex:
+    """Search structure for fuzzy matching locations against pytz timezones.
+
+    The name variants compared for each timezone ("sydney",
+    "australia sydney", "sydney australia", ...) are normalized once, along
+    with a count of the characters in each variant.  The character counts
+    give a cheap upper bound on the fuzzy_match() ratio of a variant, so
+    only the variants that could still beat the best score found so far
+    have to be scored exactly.
+    """
+
+    def __init__(self, zone_names):
+        self.zone_names = list(zone_names)
+        # (variant text, character counts, index into zone_names)
+        self.variants = []
+        for idx, name in enumerate(self.zone_names):
+            for variant in self._name_variants(name):
+                self.variants.append((variant, Counter(variant), idx))
+
+    @staticmethod
+    def _name_variants(name):
+        # Separate at '/'
+        normalized = name.lower().replace("_", " ").split("/")
+        if len(normalized) == 1:
+            return [normalized[0]]
+        # Locations like "Sydney", "Sydney Australia" or
+        # "Center North Dakota"
+        variants = [normalized[1],
+                    normalized[-2] + " " + normalized[-1],
+                    normalized[-1] + " " + normalized[-2]]
+        return list(dict.fromkeys(variants))
+
+    def best_match(self, location):
+        """Find the timezone name best matching a location.
+
+        The result is identical to fuzzy matching the location against
+        every variant of every timezone name, with ties going to the zone
+        that comes last in the list.
+
+        Returns:
+            tuple: (confidence, timezone name), or None if the index is empty
+        """
+        target = location.lower()
+        target_counts = Counter(target)
+        candidates = []
+        for text, counts, idx in self.variants:
+            overlap = sum(min(n, counts[c]) for c, n in target_counts.items())
+            # Same formula as SequenceMatcher.ratio(), using the number of
+            # shared characters as an upper bound on the matching ones
+            bound = 2.0 * overlap / (len(text) + len(target))
+            candidates.append((bound, idx, text))
+        candidates.sort(reverse=True)
+
+        best = None
+        for bound, idx, text in candidates:
+            if best and bound < best[0]:
+                break  # no remaining variant can reach the best score
+            pct = fuzzy_match(text, target)
+            if not best or (pct, idx) > best:
+                best = (pct, idx)
+        if not best:
+            return None
+        return best[0], self.zone_names[best[1]]
+
+
+class UtcOffsetTable:
+    """UTC offsets of a pytz timezone over a window of time.
+
+    pytz converts a moment by searching the whole transition history of
+    the zone.  This keeps just the transitions within the window, so
+    converting a moment in it compares against a few transition times and
+    adds the offset in effect.
+    """
+
+    def __init__(self, tz, start, span=OFFSET_TABLE_SPAN):
+        """
+        Arguments:
+            tz (BaseTzInfo): pytz timezone
+            start (datetime): naive UTC start of the window
+            span (timedelta): length of the window
+        """
+        self.start = start
+        self.end = start + span
+        # (naive UTC time the offset starts, offset, tzinfo to attach)
+        self.transitions = []
+        times = getattr(tz, "_utc_transition_times", None)
+        if times:
+            idx = max(bisect_right(times, start) - 1, 0)
+            for t, info in zip(times[idx:], tz._transition_info[idx:]):
+                if t >= self.end and self.transitions:
+                    break
+                self.transitions.append((t, info[0], tz._tzinfos[info]))
+        else:
+            # Fixed offset timezone
+            self.transitions.append((datetime.datetime.min,
+                                     tz.utcoffset(start), tz))
+
+    def convert(self, dt):
+        """Convert an aware datetime to the timezone.
+
+        Returns:
+            datetime: same result as dt.astimezone(tz), or None if dt is
+                      outside the window
+        """
+        utc = dt.replace(tzinfo=None) - dt.utcoffset()
+        if not self.start <= utc < self.end:
+            return None
+        for t, offset, tzinfo in reversed(self.transitions):
+            if utc >= t:
+                return (utc + offset).replace(tzinfo=tzinfo)
+        return None
+
+
+class _NoSpan:
+    """Stand-in for a timing span while metrics are disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class _Span:
+    def __init__(self, metrics, stage):
+        self.metrics = metrics
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.metrics.add(self.stage, time.perf_counter() - self.start)
+        return False
+
+
+class StageMetrics:
+    """Latency samples of the stages of handling a query.
+
+    The last STAGE_SAMPLES durations of each stage are kept and summarized
+    as percentiles.  While disabled, spans are a shared no-op object.
+    """
+    NO_SPAN = _NoSpan()
+
+    def __init__(self, enabled=False, samples=STAGE_SAMPLES):
+        self.enabled = enabled
+        self.size = samples
+        self.samples = {}  # stage: deque of durations in seconds
+
+    def span(self, stage):
+        """Time a block of code:  with metrics.span("stage"): ..."""
+        if not self.enabled:
+            return self.NO_SPAN
+        return _Span(self, stage)
+
+    def add(self, stage, seconds):
+        if stage not in self.samples:
+            self.samples[stage] = deque(maxlen=self.size)
+        self.samples[stage].append(seconds)
+
+    @staticmethod
+    def _percentile(ordered, pct):
+        # nearest rank
+        return ordered[max(math.ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+    def summary(self):
+        """Summarize the recorded stages.
+
+        Returns:
+            dict: stage to count and p50, p95 and p99 in milliseconds
+        """
+        result = {}
+        for stage, samples in self.samples.items():
+            ordered = sorted(samples)
+            result[stage] = {"count": len(ordered)}
+            for pct in (50, 95, 99):
+                ms = self._percentile(ordered, pct) * 1000
+                result[stage]["p{}".format(pct)] = round(ms, 3)
+        return result
+
+
+def timed(stage):
+    """Decorate a TimeSkill method to record its duration as a stage."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.span(stage):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def synchronized(cache):
+    """Decorate a TimeSkill method to run while holding a cache's lock.
+
+    The caches are used by the intent and scheduler threads and filled by
+    the warm-up thread.  Each cache has its own lock in
+    TimeSkill.cache_locks, so a query only waits for a warm-up step that
+    builds something the query needs.
+
+    Arguments:
+        cache (str): name of the cache in TimeSkill.cache_locks
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.cache_locks[cache]:
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class UtteranceParse:
+    """Parse results of one utterance, each computed at most once.
+
+    Handlers reached for the same message share one instance, see
+    TimeSkill.get_parse().
+    """
+
+    def __init__(self, utterance, extract_location):
+        self.utterance = utterance
+        self.text = utterance.lower()
+        self._extract_location = extract_location
+        self._results = {}
+
+    def _get(self, key, compute):
+        if key not in self._results:
+            self._results[key] = compute()
+        return self._results[key]
+
+    @property
+    def normalized(self):
+        """Lowercased and normalized utterance."""
+        return self._get("normalized", lambda: normalize(self.text))
+
+    def extract_datetime(self, text):
+        """Get extract_datetime() of the text: (datetime, remainder) or None"""
+        return self._get(("datetime", text), lambda: extract_datetime(text))
+
+    def location(self, text):
+        """Location named in the text, or None."""
+        return self._get(("location", text),
+                         lambda: self._extract_location(text))
+
+    @property
+    def year(self):
+        """Year named in the utterance, or None."""
+        def find_year():
+            year = extract_number(self.text)
+            if not year or year < 1500 or year > 3000:  # filter out non-years
+                return None
+            return year
+        return self._get("year", find_year)
+
+
+class TimezoneCache:
+    """Least recently used cache of location to timezone resolutions.
+
+    Entries expire after a time to live.  Failed lookups are cached as
+    None so repeated unknown locations don't rerun the fuzzy match.  The
+    whole cache is dropped when its context (e.g. device location and
+    language) changes.
+    """
+
+    def __init__(self, size=TIMEZONE_CACHE_SIZE, ttl=TIMEZONE_CACHE_TTL):
+        self.size = size
+        self.ttl = ttl
+        self.context = None
+        self.entries = OrderedDict()  # key: (expiry, timezone)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(locale):
+        return " ".join(locale.lower().split())
+
+    def set_context(self, context):
+        """Drop all entries if the context they were resolved in changed."""
+        if context != self.context:
+            self.entries.clear()
+            self.context = context
+
+    def lookup(self, locale):
+        """Look up a cached resolution.
+
+        Returns:
+            tuple: (found, timezone).  timezone is None for a cached failure.
+        """
+        key = self.normalize(locale)
+        entry = self.entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+        if entry:
+            del self.entries[key]  # expired
+        self.misses += 1
+        return False, None
+
+    def store(self, locale, timezone):
+        key = self.normalize(locale)
+        self.entries[key] = (time.monotonic() + self.ttl, timezone)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    @property
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self.entries)}
+
+
+class GuiState:
+    """Track what was last sent to the Mycroft GUI.
+
+    Every value set and every page shown is a messagebus message, so
+    values that didn't change and a page that is already showing aren't
+    sent again.
+    """
+
+    def __init__(self, gui):
+        self.gui = gui
+        self.values = {}
+        self.page = None
+        self.suppressed = 0  # messages not sent
+
+    def __setitem__(self, key, value):
+        if key in self.values and self.values[key] == value:
+            self.suppressed += 1
+        else:
+            self.values[key] = value
+            self.gui[key] = value
+
+    def show_page(self, page, override=False):
+        """Show a page unless it is already showing.
+
+        Arguments:
+            page (str): page to show
+            override (bool): show the page even if it was the last one
+                             shown, e.g. another skill may have replaced it
+        """
+        if page == self.page and not override:
+            self.suppressed += 1
+        else:
+            self.page = page
+            self.gui.show_page(page)
+
+    def clear(self):
+        """Clear the GUI and forget everything sent before."""
+        self.gui.clear()
+        self.values = {}
+        self.page = None
+
+
 class TimeSkill(MycroftSkill):
 
     def __init__(self):
+        init_start = time.monotonic()
         super(TimeSkill, self).__init__("TimeSkill")
-        self.astral = Astral()
+        self.cache_locks = {cache: threading.Lock() for cache in CACHES}
+        self._astral = None
+        self._timezone_index = None
+        self._city_timezones = None
+        self.resource_bundles = {}  # lang: [bundle, time last checked]
+        self.metrics = StageMetrics()
+        self._parse = None  # (message, UtteranceParse) of the last query
+        self.day_strings = OrderedDict()  # (date, lang, format): DayStrings
+        self.solar_events = OrderedDict()  # (lat, lon, date): SolarEvents
+        self.countdown_table = None
+        self.timezone_cache = TimezoneCache()
+        self.location_patterns = {}  # lang: (bundle, compiled patterns)
+        self.offset_tables = OrderedDict()  # zone name: UtcOffsetTable
+        self.gui_state = GuiState(self.gui)
         self.displayed_time = None
+        self.mark1_frame = None  # faceplate columns last drawn
+        self.alarm_set = False  # last alarm state reported by alarm skill
         self.display_tz = None
         self.answering_query = False
+        self.restore_scheduled = False
+        self.reset_mouth_on_restore = False
+        self.resting_screen_active = False
+        self.clock_scheduled = False
+        self.clock_wakeups = deque()  # times of clock updates, last hour
+        self.warmup_thread = None
+        self.warmup_cancelled = threading.Event()
         self.log.info('test')
         self.log.info('test again')
+        self.startup_times = OrderedDict()
+        self.startup_times["__init__"] = time.monotonic() - init_start
 
     def initialize(self):
-        # Start a callback that repeats every 10 seconds
-        # TODO: Add mechanism to only start timer when UI setting
-        #       is checked, but this requires a notifier for settings
-        #       updates from the web.
+        initialize_start = time.monotonic()
+        self.settings.set_changed_callback(self.on_settings_changed)
+        self.add_event("private.mycroftai.has_alarm.response",
+                       self.handle_alarm_status)
+        self.add_event("private.mycroftai.date_time.metrics",
+                       self.handle_metrics_query)
+        self.add_event("mycroft.skill.handler.start",
+                       self.handle_skill_handler_start)
+        self.request_alarm_status()
+        self.apply_metrics_setting()
+        self.schedule_clock()
+        self.start_warmup()
+        self.startup_times["initialize"] = (time.monotonic() -
+                                            initialize_start)
+        self.log.info("Startup times: {}".format(self.startup_report))
+
+    def shutdown(self):
+        self.cancel_warmup()
+
+    def start_warmup(self):
+        """Build the lookup caches in the background.
+
+        Otherwise the first time or holiday question after boot pays for
+        building them.  Queries arriving before the warm-up is done build
+        whatever they need themselves, like they would without it.
+        """
+        self.warmup_cancelled.clear()
+        self.warmup_thread = threading.Thread(target=self.warmup,
+                                              name="TimeSkillWarmup",
+                                              daemon=True)
+        self.warmup_thread.start()
+
+    def cancel_warmup(self):
+        """Stop the cache warm-up after its current step."""
+        self.warmup_cancelled.set()
+
+    def warmup(self):
+        year = datetime.date.today().year
+        steps = [
+            ("timezone index", lambda: self.timezone_index),
+            ("city timezones", lambda: self.city_timezones),
+            ("resource bundle", self.get_resource_bundle),
+            ("home timezone", lambda: self._to_timezone(
+                now_utc(), self.get_timezone(self.location_timezone))),
+            ("solar events", self.is_daytime),
+            ("holidays", lambda: [get_holiday_table("US", y)
+                                  for y in (year, year + 1)]),
+            ("holiday names", lambda: get_holiday_matcher("US", year)),
+            ("holiday countdown", self.get_countdown_table)
+        ]
+
+        if self.warmup_cancelled.wait(WARMUP_DELAY):
+            return
+        duration = 0  # not counting the pauses
+        for name, step in steps:
+            start = time.monotonic()
+            try:
+                step()
+            except Exception:
+                self.log.exception("Cache warm-up of {} failed".format(name))
+            duration += time.monotonic() - start
+            if self.warmup_cancelled.wait(WARMUP_PAUSE):
+                self.log.info("Cache warm-up cancelled")
+                return
+        self.startup_times["warm-up"] = duration
+        self.log.info("Cache warm-up took {:.0f} ms".format(
+            self.startup_times["warm-up"] * 1000))
+
+    @property
+    def startup_report(self):
+        """Seconds spent on startup steps and on loading dependencies."""
+        report = OrderedDict(self.startup_times)
+        for name, seconds in IMPORT_TIMES.items():
+            report["import " + name] = seconds
+        return report
+
+    @property
+    @synchronized("astral")
+    def astral(self):
+        """Astral city database, loaded on first use."""
+        if not self._astral:
+            astral = import_on_use("astral")
+            start = time.monotonic()
+            self._astral = astral.Astral()
+            self.startup_times["Astral()"] = time.monotonic() - start
+        return self._astral
+
+    @property
+    @synchronized("timezone index")
+    def timezone_index(self):
+        """Fuzzy match index of the pytz timezones, built on first use."""
+        if not self._timezone_index:
+            self._timezone_index = TimezoneIndex(pytz.all_timezones)
+        return self._timezone_index
+
+    def on_settings_changed(self):
+        # Applies the new show_time value (erasing the clock if it was
+        # turned off) and starts or stops the clock updates to match.
+        self.update_display()
+        self.schedule_clock()
+        self.apply_metrics_setting()
+
+    def apply_metrics_setting(self):
+        """Turn stage latency metrics on or off from the skill settings.
+
+        The "stage_metrics" setting isn't shown in the settings UI, it is
+        meant to be set in the skill's settings.json while profiling.
+        """
+        enabled = bool(self.settings.get("stage_metrics", False))
+        if enabled != self.metrics.enabled:
+            self.metrics.enabled = enabled
+            if enabled:
+                self.schedule_repeating_event(self.log_metrics, None,
+                                              STAGE_LOG_INTERVAL,
+                                              name="LogMetrics")
+            else:
+                self.cancel_scheduled_event("LogMetrics")
+
+    def get_metrics(self):
+        """Collect stage latencies and the counters of the skill caches."""
+        return {
+            "stages": self.metrics.summary(),
+            "timezone_cache": self.timezone_cache.stats,
+            "gui_messages_suppressed": self.gui_state.suppressed,
+            "clock_wakeups_per_hour": self.clock_wakeups_per_hour
+        }
+
+    def log_metrics(self, message=None):
+        self.log.info("Metrics: {}".format(self.get_metrics()))
+
+    def handle_metrics_query(self, message):
+        self.bus.emit(message.response(self.get_metrics()))
+
+    def _is_clock_wanted(self):
+        """Check if anything shows the clock between queries."""
+        return (self.settings.get("show_time", False) or
+                self.resting_screen_active)
+
+    def schedule_clock(self):
+        """Schedule the next clock update at the start of the next minute.
+
+        The displayed time only changes once a minute, so there is one
+        update per minute.  Each update schedules the next one from the
+        current time, which keeps the clock in step with the minute after
+        drift, DST or timezone changes.  While nothing shows the clock no
+        update is scheduled.
+        """
+        if self.clock_scheduled:
+            self.cancel_scheduled_event("ClockUpdate")
+            self.clock_scheduled = False
+        if not self._is_clock_wanted():
+            return
+
         now = datetime.datetime.now()
         callback_time = (datetime.datetime(now.year, now.month, now.day,
                                            now.hour, now.minute) +
                          datetime.timedelta(seconds=60))
-        self.schedule_repeating_event(self.update_display, callback_time, 10)
+        self.schedule_event(self.handle_clock_update, callback_time,
+                            name="ClockUpdate")
+        self.clock_scheduled = True
+
+    def handle_clock_update(self, message=None):
+        self.clock_scheduled = False
+        now = time.monotonic()
+        self.clock_wakeups.append(now)
+        while self.clock_wakeups[0] < now - 3600:
+            self.clock_wakeups.popleft()
+        self.update_display()
+        self.schedule_clock()
+
+    @property
+    def clock_wakeups_per_hour(self):
+        """Number of clock updates during the last hour."""
+        return len(self.clock_wakeups)
 
     # TODO:19.08 Moved to MycroftSkill
     @property
@@ -85,46 +1020,190 @@ class TimeSkill(MycroftSkill):
 
     @resting_screen_handler('Time and Date')
     def handle_idle(self, message):
-        self.gui.clear()
+        # Send everything again in case the GUI was reset meanwhile
+        self.gui_state.clear()
         self.log.debug('Activating Time/Date resting page')
-        self.gui['time_string'] = self.get_display_current_time()
-        self.gui['ampm_string'] = ''
-        self.gui['date_string'] = self.get_display_date()
-        self.gui['weekday_string'] = self.get_weekday()
-        self.gui['month_string'] = self.get_month_date()
-        self.gui['year_string'] = self.get_year()
-        self.gui.show_page('idle.qml')
+        self.resting_screen_active = True
+        if not self.clock_scheduled:
+            self.schedule_clock()
+        snapshot = self.get_clock_snapshot()
+        self.gui_state['time_string'] = snapshot.time_string
+        self.gui_state['ampm_string'] = ''
+        self.gui_state['date_string'] = snapshot.date_string
+        self.gui_state['weekday_string'] = snapshot.weekday_string
+        self.gui_state['month_string'] = snapshot.month_string
+        self.gui_state['year_string'] = snapshot.year_string
+        self.gui_state['daytime'] = self.is_daytime()
+        self.gui_state.show_page('idle.qml')
+
+    def handle_skill_handler_start(self, message):
+        """Note that the resting screen was replaced.
+
+        Any intent handler, of this skill or another, takes over the screen.
+        The resting screen handler is called again when it comes back, so
+        until then the clock updates for it stop.
+        """
+        if self.resting_screen_active:
+            self.resting_screen_active = False
+            self.schedule_clock()
 
     @property
     def use_24hour(self):
         return self.config_core.get('time_format') == 'full'
 
     def _get_timezone_from_builtins(self, locale):
-        try:
-            # This handles common city names, like "Dallas" or "Paris"
-            return pytz.timezone(self.astral[locale].timezone)
-        except Exception:
-            pass
-
-        try:
-            # This handles codes like "America/Los_Angeles"
-            return pytz.timezone(locale)
-        except Exception:
-            pass
+        # This handles common city names, like "Dallas" or "Paris" and
+        # codes like "America/Los_Angeles"
+        zone = self.city_timezones.get(normalize_city_name(locale))
+        if zone:
+            return pytz.timezone(zone)
         return None
 
+    @property
+    @synchronized("city timezones")
+    def city_timezones(self):
+        """Table of city and timezone names, see build_city_timezones().
+
+        The table is cached in a file and only rebuilt when the installed
+        pytz or astral change.
+        """
+        if self._city_timezones is None:
+            versions = get_library_versions()
+            try:
+                with self.file_system.open(CITY_TIMEZONES_FILE, "r") as f:
+                    cached = json.load(f)
+                if cached["versions"] == versions:
+                    self._city_timezones = cached["table"]
+            except Exception:
+                pass  # missing or unreadable cache
+
+        if self._city_timezones is None:
+            self._city_timezones = build_city_timezones(self.astral)
+            try:
+                with self.file_system.open(CITY_TIMEZONES_FILE, "w") as f:
+                    json.dump({"versions": versions,
+                               "table": self._city_timezones}, f)
+            except Exception:
+                self.log.warning("Couldn't cache the city timezone table")
+        return self._city_timezones
+
     def _get_timezone_from_table(self, locale):
         """Check lookup table for timezones.
 
         This can also be a translation layer.
         E.g. "china = GMT+8"
         """
-        timezones = self.translate_namedvalues("timezone.value")
-        for timezone in timezones:
-            if locale.lower() == timezone.lower():
+        zone = self.get_resource_bundle()["timezones"].get(locale.lower())
+        return pytz.timezone(zone) if zone else None
+
+    @synchronized("resource bundle")
+    def get_resource_bundle(self):
+        """Get the parsed resource files of the current language.
+
+        The resources read by the skill itself (the timezone.value and
+        solar.event.value tables and the location.rx patterns) are parsed
+        into a bundle, which is
+        saved to a single file.  Later skill loads read that file instead
+        of the resource files, until one of them changes.
+
+        Returns:
+            dict: bundle made by build_resource_bundle()
+        """
+        cached = self.resource_bundles.get(self.lang)
+        now = time.monotonic()
+        if cached and now - cached[1] < RESOURCE_CHECK_INTERVAL:
+            return cached[0]
+
+        bundle = cached[0] if cached else self._read_resource_bundle()
+        if not self._is_bundle_current(bundle):
+            bundle = self.build_resource_bundle()
+            try:
+                with self.file_system.open(
+                        RESOURCE_BUNDLE_FILE.format(self.lang), "wb") as f:
+                    f.write(marshal.dumps(bundle))
+            except Exception:
+                self.log.warning("Couldn't save the resource bundle")
+        self.resource_bundles[self.lang] = [bundle, now]
+        return bundle
+
+    def _read_resource_bundle(self):
+        try:
+            with self.file_system.open(RESOURCE_BUNDLE_FILE.format(self.lang),
+                                       "rb") as f:
+                return marshal.loads(f.read())
+        except Exception:
+            return None  # missing or unreadable bundle
+
+    def _find_bundle_sources(self):
+        """Get the file each bundle resource resolves to, None if missing.
+
+        A bundle is stale when one of these changes, e.g. when a
+        translation adds a resource file its language didn't have.
+        """
+        return [self.find_resource(resource, directory)
+                for resource, directory in RESOURCE_BUNDLE_SOURCES]
+
+    def _is_bundle_current(self, bundle):
+        """Check if a bundle was built from the current resource files."""
+        try:
+            return (bundle["version"] == RESOURCE_BUNDLE_VERSION and
+                    bundle["lang"] == self.lang and
+                    bundle["pytz"] == pytz.__version__ and
+                    bundle["resources"] == self._find_bundle_sources() and
+                    get_file_signatures(bundle["sources"]) ==
+                    bundle["sources"])
+        except (TypeError, KeyError, OSError):
+            return False
+
+    def build_resource_bundle(self):
+        """Parse the resource files of the current language.
+
+        Returns:
+            dict: "timezones" maps lowercased names to timezone names,
+                  "solar_events" maps lowercased names of sun events to
+                  SolarEvents fields, and "location_patterns" has the
+                  location.rx patterns with a "Location" group.  The other
+                  entries identify what the bundle was built from.
+        """
+        resources = self._find_bundle_sources()
+        _, rx_file, solar_file = resources
+        timezones = {}
+        for name, zone in self.translate_namedvalues("timezone.value").items():
+            try:
                 # assumes translation is correct
-                return pytz.timezone(timezones[timezone].strip())
-        return None
+                timezones.setdefault(name.lower(),
+                                     pytz.timezone(zone.strip()).zone)
+            except pytz.UnknownTimeZoneError:
+                self.log.warning("Unknown timezone {} for {} in "
+                                 "timezone.value".format(zone, name))
+
+        solar_events = {}
+        if solar_file:
+            for name, event in self.translate_namedvalues(
+                    "solar.event.value").items():
+                solar_events[name.strip().lower()] = event.strip()
+
+        # Patterns without a "Location" group can never produce a
+        # location, so they are dropped here
+        location_patterns = []
+        if rx_file:
+            with open(rx_file) as f:
+                for pat in f.read().splitlines():
+                    pat = pat.strip()
+                    if not pat or pat[0] == "#":
+                        continue
+                    if "Location" in re.compile(pat).groupindex:
+                        location_patterns.append(pat)
+
+        return {"version": RESOURCE_BUNDLE_VERSION,
+                "lang": self.lang,
+                "pytz": pytz.__version__,
+                "resources": resources,
+                "sources": get_file_signatures(
+                    [filename for filename in resources if filename]),
+                "timezones": timezones,
+                "solar_events": solar_events,
+                "location_patterns": location_patterns}
 
     def _get_timezone_from_fuzzymatch(self, locale):
         """Fuzzymatch a location against the pytz timezones.
@@ -137,73 +1216,152 @@ class TimeSkill(MycroftSkill):
              "Etc/Zulu", ... "US/Eastern", ... "UTC", ..., "Zulu"]
 
         These are parsed and compared against the provided location.
+
+        Returns:
+            (timezone, sure): the best matching timezone, or None if
+            nothing is close, and False if the match is only close enough
+            to be confirmed by the user with _confirm_timezone()
         """
-        target = locale.lower()
-        best = None
-        for name in pytz.all_timezones:
-            # Separate at '/'
-            normalized = name.lower().replace("_", " ").split("/")
-            if len(normalized) == 1:
-                pct = fuzzy_match(normalized[0], target)
-            elif len(normalized) >= 2:
-                # Check for locations like "Sydney"
-                pct1 = fuzzy_match(normalized[1], target)
-                # locations like "Sydney Australia" or "Center North Dakota"
-                pct2 = fuzzy_match(normalized[-2] + " " + normalized[-1],
-                                   target)
-                pct3 = fuzzy_match(normalized[-1] + " " + normalized[-2],
-                                   target)
-                pct = max(pct1, pct2, pct3)
-            if not best or pct >= best[0]:
-                best = (pct, name)
+        best = self.timezone_index.best_match(locale)
         if best and best[0] > 0.8:
             # solid choice
-            return pytz.timezone(best[1])
+            return pytz.timezone(best[1]), True
         elif best and best[0] > 0.3:
-            say = speakable_timezone(best[1])
-            if self.ask_yesno("did.you.mean.timezone",
-                              data={"zone_name": say}) == "yes":
-                return pytz.timezone(best[1])
+            return pytz.timezone(best[1]), False
         else:
-            return None
+            return None, True
+
+    def _confirm_timezone(self, timezone):
+        """Ask the user if a timezone is the one they meant."""
+        say = speakable_timezone(timezone.zone)
+        if self.ask_yesno("did.you.mean.timezone",
+                          data={"zone_name": say}) == "yes":
+            return timezone
+        return None
 
+    @timed("get_timezone")
     def get_timezone(self, locale):
         """Get the timezone.
 
         This uses a variety of approaches to determine the intended timezone.
+        Results are cached until the device location or language changes,
+        except those the user was asked to confirm.
         """
+        context = (self.lang, self.location_timezone)
+        with self.cache_locks["timezones"]:
+            self.timezone_cache.set_context(context)
+            found, timezone = self.timezone_cache.lookup(locale)
+        if found:
+            return timezone
+
         timezone = self._get_timezone_from_builtins(locale)
         if not timezone:
             timezone = self._get_timezone_from_table(locale)
+        sure = True
         if not timezone:
-            timezone = self._get_timezone_from_fuzzymatch(locale)
-
+            timezone, sure = self._get_timezone_from_fuzzymatch(locale)
+        if not sure:
+            # The answer depends on the user, so it isn't remembered
+            return self._confirm_timezone(timezone)
+
+        with self.cache_locks["timezones"]:
+            # Unless the context changed while resolving
+            if self.timezone_cache.context == context:
+                self.timezone_cache.store(locale, timezone)
         return timezone
 
-    def get_local_datetime(self, location, dtUTC=None):
-        if not dtUTC:
-            dtUTC = now_utc()
-        if self.display_tz:
+    def _get_location_timezone(self, location):
+        """Get the timezone used to show the time of a location.
+
+        With no location this is the timezone the user asked times to be
+        shown in, or else the device timezone.
+        """
+        if location:
+            return self.get_timezone(location)
+        elif self.display_tz:
             # User requested times be shown in some timezone
-            tz = self.display_tz
+            return self.display_tz
         else:
-            tz = self.get_timezone(self.location_timezone)
+            return self.get_timezone(self.location_timezone)
 
-        if location:
-            tz = self.get_timezone(location)
+    def _to_timezone(self, dt, tz):
+        """Convert a datetime to a timezone.
+
+        Conversions of moments around now to pytz timezones use a table
+        of the zone's UTC offsets, built when the zone is first used and
+        rebuilt once its window has passed.
+        """
+        if dt.tzinfo is None or not isinstance(tz, pytz.BaseTzInfo):
+            return dt.astimezone(tz)
+
+        now = datetime.datetime.utcnow()
+        with self.cache_locks["offset tables"]:
+            table = self.offset_tables.get(tz.zone)
+            if table and table.end > now:
+                self.offset_tables.move_to_end(tz.zone)
+            else:
+                table = None
+        if not table:
+            # Start a little early to cover questions about yesterday
+            table = UtcOffsetTable(tz, now - datetime.timedelta(days=1))
+            with self.cache_locks["offset tables"]:
+                self.offset_tables[tz.zone] = table
+                self.offset_tables.move_to_end(tz.zone)
+                while len(self.offset_tables) > OFFSET_TABLE_COUNT:
+                    self.offset_tables.popitem(last=False)
+
+        return table.convert(dt) or dt.astimezone(tz)
+
+    def get_local_datetime(self, location, dtUTC=None):
+        if not dtUTC:
+            dtUTC = now_utc()
+        tz = self._get_location_timezone(location)
         if not tz:
             self.speak_dialog("time.tz.not.found", {"location": location})
             return None
 
-        return dtUTC.astimezone(tz)
+        return self._to_timezone(dtUTC, tz)
+
+    def get_day_strings(self, day):
+        """Get all renderings of a date.
+
+        They are computed once per date, language and date format, so the
+        idle clock and date queries only look them up until the local date
+        changes at midnight.
+
+        Arguments:
+            day (date or datetime): local date
+
+        Returns:
+            DayStrings
+        """
+        date_format = self.config_core.get('date_format')
+        key = (day.year, day.month, day.day, self.lang, date_format)
+        with self.cache_locks["day strings"]:
+            strings = self.day_strings.get(key)
+            if strings:
+                self.day_strings.move_to_end(key)
+                return strings
+
+        if date_format == 'MDY':
+            date_string = day.strftime("%-m/%-d/%Y")
+        else:
+            date_string = day.strftime("%Y/%-d/%-m")
+        strings = DayStrings(date_string,
+                             day.strftime("%A"),
+                             day.strftime("%B %d"),
+                             day.strftime("%Y"),
+                             nice_date(day, lang=self.lang))
+        with self.cache_locks["day strings"]:
+            self.day_strings[key] = strings
+            while len(self.day_strings) > DAY_STRINGS_CACHE_SIZE:
+                self.day_strings.popitem(last=False)
+        return strings
 
     def get_display_date(self, day=None, location=None):
         if not day:
             day = self.get_local_datetime(location)
-        if self.config_core.get('date_format') == 'MDY':
-            return day.strftime("%-m/%-d/%Y")
-        else:
-            return day.strftime("%Y/%-d/%-m")
+        return self.get_day_strings(day).date_string
 
     def get_display_current_time(self, location=None, dtUTC=None):
         # Get a formatted digital clock time based on the user preferences
@@ -214,6 +1372,31 @@ class TimeSkill(MycroftSkill):
         return nice_time(dt, self.lang, speech=False,
                          use_24hour=self.use_24hour)
 
+    @timed("clock_snapshot")
+    def get_clock_snapshot(self, location=None, day=None):
+        """Render all clock strings for a single moment.
+
+        Arguments:
+            location (str): location to show, None for the device location
+            day (datetime): moment to show, defaults to now
+
+        Returns:
+            ClockSnapshot: or None if the location's timezone wasn't found
+        """
+        if not day:
+            day = self.get_local_datetime(location)
+            if not day:
+                return None
+        strings = self.get_day_strings(day)
+        return ClockSnapshot(day,
+                             nice_time(day, self.lang, speech=False,
+                                       use_24hour=self.use_24hour),
+                             strings.date_string,
+                             strings.weekday_string,
+                             strings.month_string,
+                             strings.year_string)
+
+    @timed("spoken_time")
     def get_spoken_current_time(self, location=None,
                                 dtUTC=None, force_ampm=False):
         # Get a formatted spoken time based on the user preferences
@@ -223,7 +1406,9 @@ class TimeSkill(MycroftSkill):
 
         # speak AM/PM when talking about somewhere else
         say_am_pm = bool(location) or force_ampm
+        return self._speak_time(dt, say_am_pm)
 
+    def _speak_time(self, dt, say_am_pm):
         s = nice_time(dt, self.lang, speech=True,
                       use_24hour=self.use_24hour, use_ampm=say_am_pm)
         # HACK: Mimic 2 has a bug with saying "AM".  Work around it for now.
@@ -231,102 +1416,246 @@ class TimeSkill(MycroftSkill):
             s = s.replace("AM", "A.M.")
         return s
 
-    def display(self, display_time):
+    def get_local_datetimes(self, locations, dtUTC=None):
+        """Get the local time of several locations at the same moment.
+
+        Each distinct location is resolved once and all of them are
+        converted from a single UTC moment.
+
+        Arguments:
+            locations (list): location names, None for the device location
+            dtUTC (datetime): moment to convert, defaults to now
+
+        Returns:
+            OrderedDict: location to local datetime, None for locations
+                         without a known timezone
+        """
+        if not dtUTC:
+            dtUTC = now_utc()
+        result = OrderedDict()
+        for location in locations:
+            if location not in result:
+                tz = self._get_location_timezone(location)
+                result[location] = self._to_timezone(dtUTC, tz) if tz else None
+        return result
+
+    def get_world_clock(self, locations, dtUTC=None):
+        """Get display and spoken times for several locations.
+
+        Arguments:
+            locations (list): location names, None for the device location
+            dtUTC (datetime): moment to show, defaults to now
+
+        Returns:
+            list: a WorldClockEntry per distinct location.  The times are
+                  None for locations without a known timezone.
+        """
+        entries = []
+        for location, dt in self.get_local_datetimes(locations,
+                                                     dtUTC).items():
+            if dt:
+                display_time = nice_time(dt, self.lang, speech=False,
+                                         use_24hour=self.use_24hour)
+                # speak AM/PM when talking about somewhere else
+                spoken_time = self._speak_time(dt, bool(location))
+            else:
+                display_time = spoken_time = None
+            entries.append(WorldClockEntry(location, dt, display_time,
+                                           spoken_time))
+        return entries
+
+    def get_coordinates(self, location=None):
+        """Get the coordinates and timezone of a location.
+
+        Arguments:
+            location (str): city name, or None for the device location
+
+        Returns:
+            (latitude, longitude, timezone), or None if the location is
+            unknown
+        """
+        if location:
+            try:
+                city = self.astral[location]
+            except KeyError:
+                return None
+            return city.latitude, city.longitude, pytz.timezone(city.timezone)
+        try:
+            coordinate = self.config_core["location"]["coordinate"]
+            return (coordinate["latitude"], coordinate["longitude"],
+                    self.get_timezone(self.location_timezone))
+        except (KeyError, TypeError):
+            return None
+
+    def get_solar_events(self, location=None, day=None):
+        """Get the times of the sun events of a day.
+
+        The events are computed once per location and local date, so the
+        idle clock and repeated questions only look them up.
+
+        Arguments:
+            location (str): city name, or None for the device location
+            day (datetime): day of the events, default is today at the
+                            location
+
+        Returns:
+            SolarEvents: local times, or None if the location is unknown
+        """
+        place = self.get_coordinates(location)
+        if not place:
+            return None
+        latitude, longitude, tz = place
+        if not day:
+            day = self._to_timezone(now_utc(), tz)
+        key = (latitude, longitude, day.year, day.month, day.day)
+        with self.cache_locks["solar events"]:
+            events = self.solar_events.get(key)
+            if events:
+                self.solar_events.move_to_end(key)
+                return events
+
+        date = datetime.date(day.year, day.month, day.day)
+        astral = self.astral
+        computations = [
+            lambda: astral.dawn_utc(date, latitude, longitude),
+            lambda: astral.sunrise_utc(date, latitude, longitude),
+            lambda: astral.solar_noon_utc(date, longitude),
+            lambda: astral.sunset_utc(date, latitude, longitude),
+            lambda: astral.dusk_utc(date, latitude, longitude)
+        ]
+        times = []
+        for compute in computations:
+            try:
+                times.append(self._to_timezone(compute(), tz))
+            except import_on_use("astral").AstralError:
+                times.append(None)  # the sun doesn't get there that day
+        events = SolarEvents(*times)
+        with self.cache_locks["solar events"]:
+            self.solar_events[key] = events
+            while len(self.solar_events) > SOLAR_EVENTS_CACHE_SIZE:
+                self.solar_events.popitem(last=False)
+        return events
+
+    def is_daytime(self, location=None):
+        """Check if the sun is up at a location.
+
+        Arguments:
+            location (str): city name, or None for the device location
+
+        Returns:
+            bool: True between sunrise and sunset, None if the location is
+                  unknown
+        """
+        events = self.get_solar_events(location)
+        if not events:
+            return None
+        now = now_utc()
+        if events.sunrise or events.sunset:
+            return ((not events.sunrise or events.sunrise <= now) and
+                    (not events.sunset or now < events.sunset))
+        # The sun stays up or down all day
+        latitude, longitude, _ = self.get_coordinates(location)
+        return self.astral.solar_elevation(now, latitude, longitude) > 0
+
+    @timed("display")
+    def display(self, display_time, snapshot=None, idle=False):
         if display_time:
             if self.platform == "mycroft_mark_1":
                 self.display_mark1(display_time)
-            self.display_gui(display_time)
+            self.display_gui(display_time, snapshot, idle)
 
     def display_mark1(self, display_time):
-        # Map characters to the display encoding for a Mark 1
-        # (4x8 except colon, which is 2x8)
-        code_dict = {
-            ':': 'CIICAA',
-            '0': 'EIMHEEMHAA',
-            '1': 'EIIEMHAEAA',
-            '2': 'EIEHEFMFAA',
-            '3': 'EIEFEFMHAA',
-            '4': 'EIMBABMHAA',
-            '5': 'EIMFEFEHAA',
-            '6': 'EIMHEFEHAA',
-            '7': 'EIEAEAMHAA',
-            '8': 'EIMHEFMHAA',
-            '9': 'EIMBEBMHAA',
-        }
+        """Draw the time on the Mark 1 faceplate.
 
-        # clear screen (draw two blank sections, numbers cover rest)
-        if len(display_time) == 4:
-            # for 4-character times, 9x8 blank
-            self.enclosure.mouth_display(img_code="JIAAAAAAAAAAAAAAAAAA",
-                                         refresh=False)
-            self.enclosure.mouth_display(img_code="JIAAAAAAAAAAAAAAAAAA",
-                                         x=22, refresh=False)
-        else:
-            # for 5-character times, 7x8 blank
-            self.enclosure.mouth_display(img_code="HIAAAAAAAAAAAAAA",
-                                         refresh=False)
-            self.enclosure.mouth_display(img_code="HIAAAAAAAAAAAAAA",
-                                         x=24, refresh=False)
-
-        # draw the time, centered on display
-        xoffset = (32 - (4*(len(display_time))-2)) / 2
-        for c in display_time:
-            if c in code_dict:
-                self.enclosure.mouth_display(img_code=code_dict[c],
-                                             x=xoffset, refresh=False)
-                if c == ":":
-                    xoffset += 2  # colon is 1 pixels + a space
-                else:
-                    xoffset += 4  # digits are 3 pixels + a space
-
-        if self._is_alarm_set():
-            # Show a dot in the upper-left
-            self.enclosure.mouth_display(img_code="CIAACA", x=29,
-                                         refresh=False)
-        else:
-            self.enclosure.mouth_display(img_code="CIAAAA", x=29,
-                                         refresh=False)
+        The whole frame is sent as a single image.  The enclosure's own
+        animations may have drawn over the faceplate since the last frame,
+        so it is never assumed to still show it.
+        """
+        frame = render_mark1_frame(display_time, self._is_alarm_set())
+        self.mark1_frame = frame
+        self.enclosure.mouth_display(img_code=encode_mark1_image(frame),
+                                     x=0, refresh=False)
+        # Keep the alarm state fresh for the next redraw
+        self.request_alarm_status()
 
     def _is_alarm_set(self):
-        """Query the alarm skill if an alarm is set."""
-        query = Message("private.mycroftai.has_alarm")
-        msg = self.bus.wait_for_response(query)
-        return msg and msg.data.get("active_alarms", 0) > 0
+        """Check the last alarm state reported by the alarm skill."""
+        return self.alarm_set
 
-    def display_gui(self, display_time):
-        """ Display time on the Mycroft GUI. """
-        self.gui.clear()
-        self.gui['time_string'] = display_time
-        self.gui['ampm_string'] = ''
-        self.gui['date_string'] = self.get_display_date()
-        self.gui.show_page('time.qml')
+    def request_alarm_status(self):
+        """Ask the alarm skill if an alarm is set.
+
+        The answer is handled by handle_alarm_status() whenever it arrives,
+        so nothing waits on the alarm skill.
+        """
+        self.bus.emit(Message("private.mycroftai.has_alarm"))
+
+    def handle_alarm_status(self, message):
+        alarm_set = message.data.get("active_alarms", 0) > 0
+        changed = alarm_set != self.alarm_set
+        self.alarm_set = alarm_set
+        # Replies to other skills' queries arrive here too, so only draw
+        # over the faceplate while the idle clock still owns it
+        if (changed and self.mark1_frame and self.displayed_time and
+                not self.answering_query and
+                self.settings.get("show_time", False) and
+                self._is_display_idle()):
+            # Update the alarm dot of the clock currently shown
+            self.display_mark1(self.displayed_time)
+            # return mouth to 'idle'
+            self.enclosure.display_manager.remove_active()
+
+    def display_gui(self, display_time, snapshot=None, idle=False):
+        """ Display time on the Mycroft GUI.
+
+        Arguments:
+            display_time (str): time to show
+            snapshot (ClockSnapshot): current clock strings, if available
+            idle (bool): True for idle clock updates, which don't need to
+                         bring the page back to front
+        """
+        self.gui_state['time_string'] = display_time
+        self.gui_state['ampm_string'] = ''
+        if snapshot:
+            self.gui_state['date_string'] = snapshot.date_string
+        else:
+            self.gui_state['date_string'] = self.get_display_date()
+        self.gui_state.show_page('time.qml', override=not idle)
 
     def _is_display_idle(self):
         # check if the display is being used by another skill right now
         # or _get_active() == "TimeSkill"
         return self.enclosure.display_manager.get_active() == ''
 
+    @timed("update_display")
     def update_display(self, force=False):
         # Don't show idle time when answering a query to prevent
         # overwriting the displayed value.
         if self.answering_query:
             return
 
-        self.gui['time_string'] = self.get_display_current_time()
-        self.gui['date_string'] = self.get_display_date()
-        self.gui['ampm_string'] = ''  # TODO
+        snapshot = self.get_clock_snapshot()
+        if not snapshot:
+            return
+        self.gui_state['time_string'] = snapshot.time_string
+        self.gui_state['date_string'] = snapshot.date_string
+        self.gui_state['ampm_string'] = ''  # TODO
+        self.gui_state['daytime'] = self.is_daytime()
 
         if self.settings.get("show_time", False):
             # user requested display of time while idle
             if (force is True) or self._is_display_idle():
-                current_time = self.get_display_current_time()
+                current_time = snapshot.time_string
                 if self.displayed_time != current_time:
                     self.displayed_time = current_time
-                    self.display(current_time)
+                    self.display(current_time, snapshot,
+                                 idle=force is not True)
                     # return mouth to 'idle'
                     self.enclosure.display_manager.remove_active()
             else:
-                self.displayed_time = None  # another skill is using display
+                # another skill is using display
+                self.displayed_time = None
+                self.mark1_frame = None
         else:
             # time display is not wanted
             if self.displayed_time:
@@ -336,23 +1665,77 @@ class TimeSkill(MycroftSkill):
                     # return mouth to 'idle'
                     self.enclosure.display_manager.remove_active()
                 self.displayed_time = None
+                self.mark1_frame = None
+
+    def hold_display(self, seconds, reset_mouth=False):
+        """Keep a query answer on the display instead of the idle clock.
+
+        The idle clock is restored by a scheduled event once the time is
+        up and speech has finished, so the intent handler doesn't wait.
+        A new query replaces the restore of the previous one.
+
+        Arguments:
+            seconds (int): minimum time to show the answer
+            reset_mouth (bool): reset the faceplate and reactivate its
+                                events when restoring
+        """
+        self.answering_query = True
+        self.reset_mouth_on_restore |= reset_mouth
+        self._schedule_restore(seconds)
+
+    def _schedule_restore(self, seconds):
+        if self.restore_scheduled:
+            self.cancel_scheduled_event("RestoreDisplay")
+        when = datetime.datetime.now() + datetime.timedelta(seconds=seconds)
+        self.schedule_event(self.handle_restore_display, when,
+                            name="RestoreDisplay")
+        self.restore_scheduled = True
+
+    def handle_restore_display(self, message=None):
+        self.restore_scheduled = False
+        if mycroft.audio.is_speaking():
+            self._schedule_restore(1)  # check again once speech is done
+            return
+
+        if self.reset_mouth_on_restore:
+            self.enclosure.mouth_reset()
+            self.enclosure.activate_mouth_events()
+            self.reset_mouth_on_restore = False
+        self.answering_query = False
+        self.displayed_time = None
+        self.mark1_frame = None
+        self.update_display()
+
+    def _get_location_patterns(self):
+        """Get the compiled location.rx patterns for the current language."""
+        bundle = self.get_resource_bundle()
+        cached = self.location_patterns.get(self.lang)
+        if not cached or cached[0] is not bundle:
+            cached = (bundle, [re.compile(pat)
+                               for pat in bundle["location_patterns"]])
+            self.location_patterns[self.lang] = cached
+        return cached[1]
+
+    def get_parse(self, message):
+        """Get the parse of a message's utterance.
+
+        Handlers passing a message on to other handlers share the parse,
+        so each part of the utterance is only parsed once.
+        """
+        if not self._parse or self._parse[0] is not message:
+            utterance = message.data.get('utterance', "")
+            self._parse = (message,
+                           UtteranceParse(utterance, self._extract_location))
+        return self._parse[1]
 
+    @timed("extract_location")
     def _extract_location(self, utt):
         # if "Location" in message.data:
         #     return message.data["Location"]
-        rx_file = self.find_resource('location.rx', 'regex')
-        if rx_file:
-            with open(rx_file) as f:
-                for pat in f.read().splitlines():
-                    pat = pat.strip()
-                    if pat and pat[0] == "#":
-                        continue
-                    res = re.search(pat, utt)
-                    if res:
-                        try:
-                            return res.group("Location")
-                        except IndexError:
-                            pass
+        for rx in self._get_location_patterns():
+            res = rx.search(utt)
+            if res:
+                return res.group("Location")
         return None
 
     ######################################################################
@@ -360,9 +1743,10 @@ class TimeSkill(MycroftSkill):
 
     @intent_handler(IntentBuilder("").require("Query").require("Time").
                     optionally("Location"))
+    @timed("handle_query_time")
     def handle_query_time(self, message):
-        utt = message.data.get('utterance', "")
-        location = self._extract_location(utt)
+        parse = self.get_parse(message)
+        location = parse.location(parse.utterance)
         current_time = self.get_spoken_current_time(location)
         if not current_time:
             return
@@ -371,28 +1755,26 @@ class TimeSkill(MycroftSkill):
         self.speak_dialog("time.current", {"time": current_time})
 
         # and briefly show the time
-        self.answering_query = True
+        self.hold_display(5, reset_mouth=True)
         self.enclosure.deactivate_mouth_events()
         self.display(self.get_display_current_time(location))
-        time.sleep(5)
-        mycroft.audio.wait_while_speaking()
-        self.enclosure.mouth_reset()
-        self.enclosure.activate_mouth_events()
-        self.answering_query = False
-        self.displayed_time = None
 
     @intent_handler("what.time.is.it.intent")
     def handle_current_time_simple(self, message):
         self.handle_query_time(message)
 
     @intent_file_handler("what.time.will.it.be.intent")
+    @timed("handle_query_future_time")
     def handle_query_future_time(self, message):
-        utt = normalize(message.data.get('utterance', "").lower())
-        extract = extract_datetime(utt)
+        parse = self.get_parse(message)
+        utt = parse.normalized
+        with self.metrics.span("extract_datetime"):
+            extract = parse.extract_datetime(utt)
+        dt = None
         if extract:
             dt = extract[0]
             utt = extract[1]
-        location = self._extract_location(utt)
+        location = parse.location(utt)
         future_time = self.get_spoken_current_time(location, dt, True)
         if not future_time:
             return
@@ -401,27 +1783,64 @@ class TimeSkill(MycroftSkill):
         self.speak_dialog("time.future", {"time": future_time})
 
         # and briefly show the time
-        self.answering_query = True
+        self.hold_display(5, reset_mouth=True)
         self.enclosure.deactivate_mouth_events()
         self.display(self.get_display_current_time(location, dt))
-        time.sleep(5)
-        mycroft.audio.wait_while_speaking()
-        self.enclosure.mouth_reset()
-        self.enclosure.activate_mouth_events()
-        self.answering_query = False
-        self.displayed_time = None
 
     @intent_handler(IntentBuilder("future_time_handler_simple").
                     require("Time").require("Future").optionally("Location"))
     def handle_future_time_simple(self, message):
         self.handle_query_future_time(message)
 
+    @intent_handler(IntentBuilder("").require("Query").require("SolarEvent").
+                    optionally("Time").optionally("Location"))
+    def handle_query_solar_event(self, message):
+        parse = self.get_parse(message)
+        utt = parse.normalized
+        with self.metrics.span("extract_datetime"):
+            extract = parse.extract_datetime(utt)
+        day = None
+        if extract:
+            day = extract[0]
+            utt = extract[1]
+        location = parse.location(utt)
+
+        events = self.get_solar_events(location, day)
+        if not events:
+            if location:
+                self.speak_dialog("location.not.found",
+                                  {"location": location})
+            else:
+                self.speak_dialog("device.location.not.found")
+            return
+        name = message.data.get("SolarEvent", "").lower()
+        field = self.get_resource_bundle()["solar_events"].get(name)
+        event_time = getattr(events, field) if field else None
+        if not event_time:
+            self.speak_dialog("solar.event.none", {"event": name})
+            return
+
+        # speak it
+        data = {"event": name,
+                "time": self._speak_time(event_time, True),
+                "location": location}
+        if location:
+            self.speak_dialog("solar.event.location", data)
+        else:
+            self.speak_dialog("solar.event", data)
+
+        # and briefly show the time
+        self.hold_display(5, reset_mouth=True)
+        self.enclosure.deactivate_mouth_events()
+        self.display(nice_time(event_time, self.lang, speech=False,
+                               use_24hour=self.use_24hour))
+
     @intent_handler(IntentBuilder("").require("Display").require("Time").
                     optionally("Location"))
     def handle_show_time(self, message):
         self.display_tz = None
-        utt = message.data.get('utterance', "")
-        location = self._extract_location(utt)
+        parse = self.get_parse(message)
+        location = parse.location(parse.utterance)
         if location:
             tz = self.get_timezone(location)
             if not tz:
@@ -435,39 +1854,28 @@ class TimeSkill(MycroftSkill):
         # show time immediately
         self.settings["show_time"] = True
         self.update_display(True)
+        self.schedule_clock()
 
     ######################################################################
     # Date queries
 
+    @timed("handle_query_date")
     def handle_query_date(self, message, response_type="simple"):
-        utt = message.data.get('utterance', "").lower()
+        parse = self.get_parse(message)
+        utt = parse.text
         try:
-            extract = extract_datetime(utt)
+            with self.metrics.span("extract_datetime"):
+                extract = parse.extract_datetime(utt)
         except Exception:
             self.speak_dialog('date.not.found')
             return
         day = extract[0] if extract else now_local()
 
         # check if a Holiday was requested, e.g. "What day is Christmas?"
-        year = extract_number(utt)
-        if not year or year < 1500 or year > 3000:  # filter out non-years
-            year = day.year
-        all_holidays = {}
-        # TODO: How to pick a location for holidays?
-        for st in holidays.US.STATES:
-            holiday_dict = holidays.US(years=[year], state=st)
-            for d, name in holiday_dict.items():
-                if name not in all_holidays:
-                    all_holidays[name] = d
-        for name in all_holidays:
-            d = all_holidays[name]
-            # Uncomment to display all holidays in the database
-            # self.log.info("Day, name: " +str(d) + " " + str(name))
-            if name.replace(" Day", "").lower() in utt:
-                day = d
-                break
-
-        location = self._extract_location(utt)
+        with self.metrics.span("holidays"):
+            day = self._find_holiday(utt, parse.year or day.year, day)
+
+        location = parse.location(utt)
         today = to_local(now_utc())
         if location:
             # TODO: Timezone math!
@@ -478,17 +1886,13 @@ class TimeSkill(MycroftSkill):
         if not day:
             return  # failed in timezone lookup
 
-        speak_date = nice_date(day, lang=self.lang)
+        speak_date = self.get_day_strings(day).spoken_date
         # speak it
         if response_type is "simple":
             self.speak_dialog("date", {"date": speak_date})
         elif response_type is "relative":
-            # remove time data to get clean dates
-            day_date = day.replace(hour=0, minute=0,
-                                   second=0, microsecond=0)
-            today_date = today.replace(hour=0, minute=0,
-                                       second=0, microsecond=0)
-            num_days = (day_date - today_date).days
+            # count calendar days, whatever the time of day
+            num_days = day.toordinal() - today.toordinal()
             if num_days >= 0:
                 speak_num_days = nice_duration(num_days * 86400)
                 self.speak_dialog("date.relative.future",
@@ -502,15 +1906,30 @@ class TimeSkill(MycroftSkill):
                                    "num_days": speak_num_days})
 
         # and briefly show the date
-        self.answering_query = True
+        self.hold_display(10,
+                          reset_mouth=self.platform == "mycroft_mark_1")
         self.show_date(location, day=day)
-        time.sleep(10)
-        mycroft.audio.wait_while_speaking()
-        if self.platform == "mycroft_mark_1":
-            self.enclosure.mouth_reset()
-            self.enclosure.activate_mouth_events()
-        self.answering_query = False
-        self.displayed_time = None
+
+    def _find_holiday(self, utt, year, day):
+        """Get the date of a holiday named in the utterance.
+
+        Arguments:
+            utt (str): lowercased utterance
+            year (int): year to look up the holiday in
+            day (datetime): date extracted from the utterance
+
+        Returns:
+            datetime: day moved to the date of the holiday, or day if no
+                      holiday was named
+        """
+        # TODO: How to pick a location for holidays?
+        if get_holiday_matcher("US", year).search(utt):
+            pattern, ranks = get_holiday_finder("US", year)
+            found = [match.group(1) for match in pattern.finditer(utt)]
+            if found:
+                d = get_holiday_table("US", year)[min(found, key=ranks.get)]
+                return day.replace(year=d.year, month=d.month, day=d.day)
+        return day
 
     @intent_handler(IntentBuilder("").require("Query").require("Date").
                     optionally("Location"))
@@ -536,15 +1955,68 @@ class TimeSkill(MycroftSkill):
         else:
             self.handle_query_date(message, response_type="relative")
 
+    def get_weekend_dates(self):
+        """Get the spoken dates of the weekend, without the year.
+
+        The days are the ones "this saturday" and "this sunday" refer to:
+        the coming Saturday (today on a Saturday) and the Sunday after it.
+        """
+        today = now_local()
+        saturday = today + datetime.timedelta(days=(5 - today.weekday()) % 7)
+        sunday = saturday + datetime.timedelta(days=1)
+        # Strip year off nice_date as request is inherently close
+        # Don't pass `now` to `nice_date` as a request on Friday will
+        # return "tomorrow", or on Monday "yesterday"
+        saturday_date = self.get_day_strings(saturday).spoken_date
+        sunday_date = self.get_day_strings(sunday).spoken_date
+        return (', '.join(saturday_date.split(', ')[:2]),
+                ', '.join(sunday_date.split(', ')[:2]))
+
+    @synchronized("countdown")
+    def get_countdown_table(self):
+        """Get the countdown table of the holidays from this year on.
+
+        Unlike the holidays named in date questions, which are looked up
+        across all states (see _find_holiday()), the countdown only lists
+        the national holidays.  Naming a state holiday is enough to pick
+        it, but listing the holidays of every state would bury the ones
+        the user has off among days most users don't observe.
+        """
+        year = now_local().year
+        if (not self.countdown_table or
+                self.countdown_table.first_year != year):
+            self.countdown_table = CountdownTable(
+                "US", year, year + COUNTDOWN_YEARS - 1)
+        return self.countdown_table
+
+    @intent_file_handler("holiday.countdown.intent")
+    def handle_holiday_countdown(self, message):
+        today = now_local()
+        upcoming = self.get_countdown_table().upcoming(today)
+
+        # speak the next few
+        for name, day, num_days in upcoming[:COUNTDOWN_SPOKEN]:
+            if num_days == 0:
+                self.speak_dialog("holiday.countdown.today",
+                                  {"holiday": name})
+            else:
+                self.speak_dialog(
+                    "holiday.countdown",
+                    {"holiday": name,
+                     "date": self.get_day_strings(day).spoken_date,
+                     "num_days": nice_duration(num_days * 86400)})
+
+        # and show all of them
+        self.gui_state['countdown'] = [
+            {"holiday": name,
+             "date": self.get_day_strings(day).date_string,
+             "days": num_days}
+            for name, day, num_days in upcoming]
+        self.gui_state.show_page('countdown.qml', override=True)
+
     @intent_file_handler("date.future.weekend.intent")
     def handle_date_future_weekend(self, message):
-        # Strip year off nice_date as request is inherently close
-        # Don't pass `now` to `nice_date` as a
-        # request on Friday will return "tomorrow"
-        saturday_date = ', '.join(nice_date(extract_datetime(
-                        'this saturday')[0]).split(', ')[:2])
-        sunday_date = ', '.join(nice_date(extract_datetime(
-                      'this sunday')[0]).split(', ')[:2])
+        saturday_date, sunday_date = self.get_weekend_dates()
         self.speak_dialog('date.future.weekend', {
             'direction': 'next',
             'saturday_date': saturday_date,
@@ -553,13 +2025,7 @@ class TimeSkill(MycroftSkill):
 
     @intent_file_handler("date.last.weekend.intent")
     def handle_date_last_weekend(self, message):
-        # Strip year off nice_date as request is inherently close
-        # Don't pass `now` to `nice_date` as a
-        # request on Monday will return "yesterday"
-        saturday_date = ', '.join(nice_date(extract_datetime(
-                        'this saturday')[0]).split(', ')[:2])
-        sunday_date = ', '.join(nice_date(extract_datetime(
-                      'this sunday')[0]).split(', ')[:2])
+        saturday_date, sunday_date = self.get_weekend_dates()
         self.speak_dialog('date.last.weekend', {
             'direction': 'last',
             'saturday_date': saturday_date,
@@ -574,6 +2040,7 @@ class TimeSkill(MycroftSkill):
         next_leap_year = self.get_next_leap_year(year)
         self.speak_dialog('next.leap.year', {'year': next_leap_year})
 
+    @timed("show_date")
     def show_date(self, location, day=None):
         if self.platform == "mycroft_mark_1":
             self.show_date_mark1(location, day)
@@ -587,35 +2054,33 @@ class TimeSkill(MycroftSkill):
     def get_weekday(self, day=None, location=None):
         if not day:
             day = self.get_local_datetime(location)
-        return day.strftime("%A")
+        return self.get_day_strings(day).weekday_string
 
     def get_month_date(self, day=None, location=None):
         if not day:
             day = self.get_local_datetime(location)
-        return day.strftime("%B %d")
+        return self.get_day_strings(day).month_string
 
     def get_year(self, day=None, location=None):
         if not day:
             day = self.get_local_datetime(location)
-        return day.strftime("%Y")
+        return self.get_day_strings(day).year_string
 
     def get_next_leap_year(self, year):
-        next_year = year + 1
-        if self.is_leap_year(next_year):
-            return next_year
-        else:
-            return self.get_next_leap_year(next_year)
+        return CountdownTable.next_leap_year(year)
 
     def is_leap_year(self, year):
         return (year % 400 == 0) or ((year % 4 == 0) and (year % 100 != 0))
 
     def show_date_gui(self, location, day):
-        self.gui.clear()
-        self.gui['date_string'] = self.get_display_date(day, location)
-        self.gui['weekday_string'] = self.get_weekday(day, location)
-        self.gui['month_string'] = self.get_month_date(day, location)
-        self.gui['year_string'] = self.get_year(day, location)
-        self.gui.show_page('date.qml')
+        snapshot = self.get_clock_snapshot(location, day)
+        if not snapshot:
+            return
+        self.gui_state['date_string'] = snapshot.date_string
+        self.gui_state['weekday_string'] = snapshot.weekday_string
+        self.gui_state['month_string'] = snapshot.month_string
+        self.gui_state['year_string'] = snapshot.year_string
+        self.gui_state.show_page('date.qml', override=True)
 
 
 def create_skill():
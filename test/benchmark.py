@@ -0,0 +1,380 @@
+# Copyright 2017, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the Date/Time skill handlers without a running Mycroft.
+
+The skill runs on the local stand-ins of test/harness.py.  The utterances
+of test/intent/*.intent.json and a synthetic corpus of city and holiday
+questions are replayed through the intent handlers.
+
+Usage:
+    python test/benchmark.py [--rounds N] [--warmup] [--json FILE]
+
+Reported per handler: calls per second and p50/p95/p99 latency, memory
+allocated per call, and the skill's own stage metrics.  Reported per
+language: time to load the skill's resources from the resource files and
+from the resource bundle, with the files evicted from the page cache where
+the OS allows it, and time to look up a timezone name and the location
+patterns once they are loaded.  The holiday countdown table is compared
+with counting the days until each holiday one query at a time.
+
+That the optimized lookups answer like the plain ones they replace is
+checked by the tests in test/test_skill.py.
+"""
+import argparse
+import calendar
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from os.path import join
+
+import pytz
+from mycroft.util.time import now_local, now_utc
+
+from harness import (SKILL_DIR, call_handler, fuzzy_match_queries,
+                     intent_corpus, legacy_best_match, load_skill,
+                     sequential_world_clock, synthetic_corpus,
+                     world_clock_locations)
+
+# Numbers of locations asked for at once in the world clock measurements
+WORLD_CLOCK_SIZES = [1, 10, 100]
+
+
+def evict(filenames):
+    """Drop files from the page cache, so the next read is from storage."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for filename in filenames:
+        try:
+            fd = os.open(filename, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def measure_resources(skill, rounds):
+    """Time loading and using the resources of each language.
+
+    Returns:
+        dict: language to milliseconds for "files" (parsing the resource
+              files), "bundle" (reading the saved bundle) and "lookup"
+              (one timezone.value lookup and getting the location patterns)
+    """
+    bundle_name = sys.modules[type(skill).__module__].RESOURCE_BUNDLE_FILE
+    skill_lang = skill.lang
+    results = {}
+    try:
+        for lang in sorted(os.listdir(join(SKILL_DIR, "dialog"))):
+            skill.lang = lang
+            bundle_file = join(skill.file_system.path,
+                               bundle_name.format(lang))
+            try:
+                sources = list(skill.build_resource_bundle()["sources"])
+            except Exception:
+                continue  # language missing resources
+            files = bundle = lookup = 0
+            for _ in range(rounds):
+                evict(sources)
+                start = time.perf_counter()
+                skill.build_resource_bundle()
+                files += time.perf_counter() - start
+
+                skill.resource_bundles.clear()
+                skill.get_resource_bundle()  # make sure the bundle is saved
+                skill.resource_bundles.clear()
+                evict(sources + [bundle_file])
+                start = time.perf_counter()
+                skill.get_resource_bundle()
+                bundle += time.perf_counter() - start
+
+                start = time.perf_counter()
+                skill._get_timezone_from_table("central time")
+                skill._get_location_patterns()
+                lookup += time.perf_counter() - start
+            results[lang] = {"files": files / rounds * 1000,
+                             "bundle": bundle / rounds * 1000,
+                             "lookup": lookup / rounds * 1000}
+    finally:
+        skill.lang = skill_lang
+    return results
+
+
+def measure_fuzzy_match(skill):
+    """Time matching locations against the timezone names.
+
+    Returns:
+        dict: milliseconds per location for "scan" (every name) and
+              "index" (the skill's TimezoneIndex), and for building the
+              index
+    """
+    queries = fuzzy_match_queries()
+    start = time.perf_counter()
+    index = sys.modules[type(skill).__module__].TimezoneIndex(
+        pytz.all_timezones)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    for query in queries:
+        index.best_match(query)
+    indexed = time.perf_counter() - start
+    start = time.perf_counter()
+    for query in queries:
+        legacy_best_match(query)
+    scanned = time.perf_counter() - start
+    return {"index_build": build * 1000,
+            "scan": scanned / len(queries) * 1000,
+            "index": indexed / len(queries) * 1000}
+
+
+def measure_world_clock(skill, rounds):
+    """Time getting the local time of many locations at once.
+
+    Returns:
+        dict: number of locations to milliseconds per call for
+              "sequential" and "batch" get_local_datetime(), and the
+              same for whole world clock entries
+    """
+    results = {}
+    for count in WORLD_CLOCK_SIZES:
+        locations = world_clock_locations(count)
+        dtUTC = now_utc()
+        timings = {"sequential": 0, "batch": 0,
+                   "sequential_entries": 0, "batch_entries": 0}
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for location in locations:
+                skill.get_local_datetime(location, dtUTC)
+            timings["sequential"] += time.perf_counter() - start
+            start = time.perf_counter()
+            skill.get_local_datetimes(locations, dtUTC)
+            timings["batch"] += time.perf_counter() - start
+            start = time.perf_counter()
+            sequential_world_clock(skill, locations, dtUTC)
+            timings["sequential_entries"] += time.perf_counter() - start
+            start = time.perf_counter()
+            skill.get_world_clock(locations, dtUTC)
+            timings["batch_entries"] += time.perf_counter() - start
+        results[count] = {name: seconds / rounds * 1000
+                          for name, seconds in timings.items()}
+    return results
+
+
+def legacy_next_leap_year(year):
+    """Next leap year, found the way the skill used to."""
+    next_year = year + 1
+    if calendar.isleap(next_year):
+        return next_year
+    return legacy_next_leap_year(next_year)
+
+
+def legacy_countdown(skill, names, today):
+    """Days until each holiday, one relative date query at a time."""
+    today_date = today.replace(hour=0, minute=0, second=0, microsecond=0)
+    countdown = []
+    for name in names:
+        utt = "how many days until " + name.lower()
+        for year in (today.year, today.year + 1):
+            day = skill._find_holiday(utt, year, today)
+            day_date = day.replace(hour=0, minute=0, second=0, microsecond=0)
+            num_days = (day_date - today_date).days
+            if num_days >= 0:
+                countdown.append((name, num_days))
+                break
+    return countdown
+
+
+def measure_countdowns(skill, rounds):
+    """Time the holiday countdown and next leap year lookups.
+
+    Returns:
+        dict: milliseconds per call for each way of getting them
+    """
+    module = sys.modules[type(skill).__module__]
+    today = now_local()
+    start = time.perf_counter()
+    table = skill.get_countdown_table()
+    build = time.perf_counter() - start
+    names = [name for name, _, _ in table.upcoming(today)
+             if name != table.LEAP_DAY]
+
+    per_event = bulk = 0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        expected = legacy_countdown(skill, names, today)
+        per_event += time.perf_counter() - start
+        start = time.perf_counter()
+        countdown = [(name, num_days)
+                     for name, _, num_days in table.upcoming(today)
+                     if name != table.LEAP_DAY]
+        bulk += time.perf_counter() - start
+    if sorted(countdown) != sorted(expected):
+        print("Countdown table disagrees: {} != {}".format(countdown,
+                                                           expected))
+
+    years = range(1600, 2600)
+    start = time.perf_counter()
+    expected = [legacy_next_leap_year(year) for year in years]
+    recursive = time.perf_counter() - start
+    start = time.perf_counter()
+    leap_years = [module.CountdownTable.next_leap_year(year)
+                  for year in years]
+    bisected = time.perf_counter() - start
+    if leap_years != expected:
+        print("Next leap years disagree")
+
+    return {"countdown_build": build * 1000,
+            "countdown_per_event": per_event / rounds * 1000,
+            "countdown_table": bulk / rounds * 1000,
+            "leap_year_recursive": recursive / len(years) * 1000,
+            "leap_year_table": bisected / len(years) * 1000}
+
+
+def percentile(ordered, pct):
+    return ordered[min(int(pct / 100 * len(ordered)), len(ordered) - 1)]
+
+
+def run(skill, corpus, rounds, errors):
+    """Replay the corpus, timing each handler call.
+
+    Returns:
+        dict: handler name to list of durations in seconds
+    """
+    durations = {}
+    for _ in range(rounds):
+        for handler, utterance, data in corpus:
+            start = time.perf_counter()
+            call_handler(skill, handler, utterance, data, errors)
+            durations.setdefault(handler, []).append(
+                time.perf_counter() - start)
+    return durations
+
+
+def measure_allocations(skill, corpus, errors):
+    """Peak bytes allocated per call of each handler, for one pass."""
+    allocated = {}
+    calls = {}
+    tracemalloc.start()
+    for handler, utterance, data in corpus:
+        tracemalloc.clear_traces()
+        call_handler(skill, handler, utterance, data, errors)
+        peak = tracemalloc.get_traced_memory()[1]
+        allocated[handler] = allocated.get(handler, 0) + peak
+        calls[handler] = calls.get(handler, 0) + 1
+    tracemalloc.stop()
+    return {handler: allocated[handler] // calls[handler]
+            for handler in allocated}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rounds", type=int, default=3,
+                        help="number of passes over the corpus")
+    parser.add_argument("--warmup", action="store_true",
+                        help="let the cache warm-up finish before the first "
+                             "pass")
+    parser.add_argument("--json", help="also write the results to FILE")
+    args = parser.parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="skill-date-time-") as data_dir:
+        benchmark(args, data_dir)
+
+
+def benchmark(args, data_dir):
+    """Run every measurement, printing the results."""
+    load_start = time.perf_counter()
+    skill = load_skill(data_dir, args.warmup, {"stage_metrics": True})
+    load_time = time.perf_counter() - load_start
+
+    corpus = intent_corpus() + synthetic_corpus()
+    errors = {}
+    # The first pass includes building the caches
+    cold = run(skill, corpus, 1, errors)
+    warm = run(skill, corpus, args.rounds, errors)
+    allocations = measure_allocations(skill, corpus, errors)
+    resources = measure_resources(skill, args.rounds)
+    countdowns = measure_countdowns(skill, args.rounds)
+    world_clock = measure_world_clock(skill, args.rounds)
+    fuzzy_matching = measure_fuzzy_match(skill)
+
+    results = {"load_seconds": load_time,
+               "startup": skill.startup_report,
+               "utterances": len(corpus),
+               "handlers": {},
+               "resources": resources,
+               "countdowns": countdowns,
+               "world_clock": world_clock,
+               "fuzzy_match": fuzzy_matching,
+               "skill_metrics": skill.get_metrics(),
+               "errors": {handler: sorted(errors[handler])
+                          for handler in errors}}
+    print("Skill load: {:.1f} ms".format(load_time * 1000))
+    print("{:<30} {:>9} {:>9} {:>9} {:>9} {:>9} {:>10}".format(
+        "handler", "calls/s", "cold ms", "p50 ms", "p95 ms", "p99 ms",
+        "alloc B"))
+    for handler in sorted(warm):
+        ordered = sorted(warm[handler])
+        stats = {
+            "calls_per_second": len(ordered) / sum(ordered),
+            "cold_ms": sum(cold[handler]) / len(cold[handler]) * 1000,
+            "p50_ms": percentile(ordered, 50) * 1000,
+            "p95_ms": percentile(ordered, 95) * 1000,
+            "p99_ms": percentile(ordered, 99) * 1000,
+            "allocated_bytes": allocations.get(handler, 0)
+        }
+        results["handlers"][handler] = stats
+        print("{:<30} {calls_per_second:>9.0f} {cold_ms:>9.2f} "
+              "{p50_ms:>9.2f} {p95_ms:>9.2f} {p99_ms:>9.2f} "
+              "{allocated_bytes:>10}".format(handler, **stats))
+
+    print("\nStage latencies (ms):")
+    for stage, stats in sorted(results["skill_metrics"]["stages"].items()):
+        print("  {:<28} p50 {p50:>8} p95 {p95:>8} p99 {p99:>8}".format(
+            stage, **stats))
+
+    print("\nResources (ms):")
+    print("  {:<8} {:>9} {:>9} {:>9}".format(
+        "lang", "files", "bundle", "lookup"))
+    for lang, stats in sorted(resources.items()):
+        print("  {:<8} {files:>9.3f} {bundle:>9.3f} {lookup:>9.4f}".format(
+            lang, **stats))
+
+    print("\nCountdowns (ms):")
+    for name, milliseconds in countdowns.items():
+        print("  {:<28} {:>9.4f}".format(name, milliseconds))
+
+    print("\nWorld clock (ms):")
+    print("  {:<10} {:>11} {:>9} {:>11} {:>9}".format(
+        "locations", "sequential", "batch", "seq entries", "entries"))
+    for count, stats in world_clock.items():
+        print("  {:<10} {sequential:>11.3f} {batch:>9.3f} "
+              "{sequential_entries:>11.3f} {batch_entries:>9.3f}".format(
+                  count, **stats))
+
+    print("\nFuzzy timezone match (ms):")
+    for name, milliseconds in fuzzy_matching.items():
+        print("  {:<28} {:>9.3f}".format(name, milliseconds))
+
+    for handler, messages in sorted(results["errors"].items()):
+        print("\n{} failed: {}".format(handler, "; ".join(messages)))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2, default=str)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
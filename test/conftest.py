@@ -0,0 +1,28 @@
+# Copyright 2017, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from harness import intent_corpus, load_skill, synthetic_corpus
+
+
+@pytest.fixture(scope="session")
+def skill(tmp_path_factory):
+    """The skill on local stand-ins, shared by the tests."""
+    return load_skill(str(tmp_path_factory.mktemp("skill-data")))
+
+
+@pytest.fixture(scope="session")
+def corpus():
+    """Intent test and synthetic (handler, utterance, intent data)."""
+    return intent_corpus() + synthetic_corpus()
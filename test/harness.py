@@ -0,0 +1,301 @@
+# Copyright 2017, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Run the Date/Time skill without a running Mycroft.
+
+The skill runs against mycroft-core as installed, but with local
+stand-ins for the messagebus, GUI, enclosure and settings, so no bus
+service, GUI, faceplate or audio is needed.  Used by the tests and by
+test/benchmark.py.
+"""
+import glob
+import importlib.util
+import json
+import sys
+from os.path import abspath, basename, dirname, join
+
+import pytz
+from mycroft.messagebus.message import Message
+from mycroft.util.format import nice_time
+from mycroft.util.parse import fuzzy_match
+
+SKILL_DIR = dirname(dirname(abspath(__file__)))
+
+# Handlers of the Padatious intents in test/intent
+FILE_INTENT_HANDLERS = {
+    "what.time.is.it.intent": "handle_current_time_simple",
+    "what.time.will.it.be.intent": "handle_query_future_time",
+    "date.future.weekend.intent": "handle_date_future_weekend",
+    "date.last.weekend.intent": "handle_date_last_weekend",
+    "holiday.countdown.intent": "handle_holiday_countdown"
+}
+
+# Number of locations matched against the timezone names both ways
+FUZZY_MATCH_QUERIES = 100
+
+HOLIDAYS = ["christmas", "thanksgiving", "independence day", "memorial day",
+            "labor day", "new year's day", "veterans day", "columbus day"]
+
+
+class RecordingBus:
+    """Messagebus stand-in recording emitted messages.
+
+    Handlers registered with on() are called for emitted messages, and
+    nothing ever answers wait_for_response().
+    """
+
+    def __init__(self):
+        self.handlers = {}
+        self.emitted = 0
+        self.waits = 0
+
+    def on(self, msg_type, handler):
+        self.handlers.setdefault(msg_type, []).append(handler)
+
+    def once(self, msg_type, handler):
+        self.on(msg_type, handler)
+
+    def remove(self, msg_type, handler):
+        if handler in self.handlers.get(msg_type, []):
+            self.handlers[msg_type].remove(handler)
+
+    def remove_all_listeners(self, msg_type):
+        self.handlers.pop(msg_type, None)
+
+    def emit(self, message):
+        self.emitted += 1
+        for handler in list(self.handlers.get(message.msg_type, [])):
+            handler(message)
+
+    def wait_for_response(self, message, reply_type=None, timeout=None):
+        self.waits += 1
+        self.emit(message)
+        return None
+
+    def wait_for_message(self, message_type, timeout=None):
+        return None
+
+
+class LocalGui(dict):
+    """GUI stand-in keeping the values set and the pages shown."""
+
+    def __init__(self):
+        super().__init__()
+        self.pages = []
+
+    def show_page(self, page, override=False):
+        self.pages.append(page)
+
+    def clear(self):
+        super().clear()
+        self.pages = []
+
+
+class LocalDisplayManager:
+    """Display manager stand-in, active is the skill using the display."""
+
+    def __init__(self):
+        self.active = ""
+
+    def get_active(self):
+        return self.active
+
+    def remove_active(self):
+        self.active = ""
+
+
+class LocalEnclosure:
+    """Enclosure stand-in recording (method name, args, kwargs) calls."""
+
+    def __init__(self):
+        self.display_manager = LocalDisplayManager()
+        self.calls = []
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+        return record
+
+
+class LocalSettings(dict):
+    """Skill settings stand-in, changed only by the caller."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.changed_callback = None
+
+    def set_changed_callback(self, callback):
+        self.changed_callback = callback
+
+
+def load_skill(data_dir, warmup=False, settings=None):
+    """Load the skill from this checkout and connect it to the stand-ins.
+
+    Arguments:
+        data_dir (str): directory for the files the skill saves, so the
+                        real skill data isn't touched
+        warmup (bool): wait for the background cache warm-up to finish,
+                       instead of cancelling it
+        settings (dict): skill settings to start with
+    """
+    spec = importlib.util.spec_from_file_location(
+        basename(SKILL_DIR), join(SKILL_DIR, "__init__.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+
+    skill = module.create_skill()
+    skill.skill_id = basename(SKILL_DIR)
+    skill.file_system.path = data_dir
+    skill.bind(RecordingBus())
+    skill.gui_state.gui = skill.gui = LocalGui()
+    skill.enclosure = LocalEnclosure()
+    skill.settings = LocalSettings(settings or {})
+    # Nobody answers "did you mean ..." questions
+    skill.ask_yesno = lambda *args, **kwargs: "no"
+    skill.initialize()
+    if not warmup:
+        skill.cancel_warmup()
+    skill.warmup_thread.join()
+    return skill
+
+
+def intent_corpus():
+    """(handler name, utterance, intent data) of the intent tests."""
+    corpus = []
+    for filename in sorted(glob.glob(join(SKILL_DIR, "test", "intent",
+                                          "*.intent.json"))):
+        with open(filename) as f:
+            test = json.load(f)
+        if "intent_type" not in test:
+            continue  # no way to tell which handler it should reach
+        handler = FILE_INTENT_HANDLERS.get(test["intent_type"],
+                                           test["intent_type"])
+        corpus.append((handler, test["utterance"], test.get("intent", {})))
+    return corpus
+
+
+def synthetic_corpus():
+    """(handler, utterance, intent data) of city and holiday questions."""
+    cities = sorted(set(zone.split("/")[-1].replace("_", " ").lower()
+                        for zone in pytz.common_timezones if "/" in zone))
+    corpus = []
+    for city in cities:
+        corpus.append(("handle_query_time",
+                       "what time is it in " + city, {}))
+        # Misspelled names exercise the fuzzy timezone match
+        corpus.append(("handle_query_time",
+                       "what time is it in " + city[:-1], {}))
+        corpus.append(("handle_query_future_time",
+                       "what time will it be in {} in 3 hours".format(city),
+                       {}))
+        corpus.append(("handle_query_date_simple",
+                       "what is the date in " + city, {}))
+        corpus.append(("handle_query_solar_event",
+                       "when is sunset in " + city, {"SolarEvent": "sunset"}))
+    corpus.append(("handle_query_solar_event", "when is sunrise",
+                   {"SolarEvent": "sunrise"}))
+    for holiday in HOLIDAYS:
+        corpus.append(("handle_query_date_simple",
+                       "what date is " + holiday, {}))
+        corpus.append(("handle_day_for_date",
+                       "when is {} {}".format(holiday, 2030), {}))
+    return corpus
+
+
+def call_handler(skill, handler, utterance, data, errors):
+    """Call a handler like the intent service would, counting failures.
+
+    The message carries the utterance and the intent data, the way the
+    intent service fills it in for a handler.
+    """
+    message = Message("recognizer_loop:utterance",
+                      dict(data, utterance=utterance))
+    try:
+        getattr(skill, handler)(message)
+    except Exception as e:
+        errors.setdefault(handler, set()).add(repr(e))
+
+
+def capture_dialogs(skill, corpus):
+    """Replay a corpus, collecting the dialogs spoken for each utterance.
+
+    Returns:
+        list: (dialog name, data) pairs spoken, per utterance
+    """
+    spoken = []
+    skill.speak_dialog = (lambda key, data=None, *args, **kwargs:
+                          spoken.append((key, data)))
+    answers = []
+    try:
+        for handler, utterance, data in corpus:
+            del spoken[:]
+            call_handler(skill, handler, utterance, data, {})
+            answers.append(list(spoken))
+    finally:
+        del skill.speak_dialog
+    return answers
+
+
+def legacy_best_match(location):
+    """Best fuzzy match of a location, scanning every timezone name.
+
+    This is how the skill matched locations before it indexed the names.
+    """
+    target = location.lower()
+    best = None
+    for name in pytz.all_timezones:
+        normalized = name.lower().replace("_", " ").split("/")
+        if len(normalized) == 1:
+            pct = fuzzy_match(normalized[0], target)
+        else:
+            pct = max(fuzzy_match(normalized[1], target),
+                      fuzzy_match(normalized[-2] + " " + normalized[-1],
+                                  target),
+                      fuzzy_match(normalized[-1] + " " + normalized[-2],
+                                  target))
+        if not best or pct >= best[0]:
+            best = (pct, name)
+    return best
+
+
+def fuzzy_match_queries():
+    """City names, misspelled and unknown names to match, some of each."""
+    cities = sorted(set(zone.split("/")[-1].replace("_", " ").lower()
+                        for zone in pytz.common_timezones if "/" in zone))
+    step = max(1, len(cities) * 2 // FUZZY_MATCH_QUERIES)
+    queries = []
+    for city in cities[::step]:
+        queries += [city, city[:-1]]
+    return queries[:FUZZY_MATCH_QUERIES - 4] + [
+        "middle earth", "gmt plus 3", "kansas", "x"]
+
+
+def world_clock_locations(count):
+    """Names of cities with a known timezone, repeating after 50."""
+    cities = sorted(set(zone.split("/")[-1].replace("_", " ").lower()
+                        for zone in pytz.common_timezones
+                        if zone.startswith("Europe/")))[:50]
+    return [cities[i % len(cities)] for i in range(count)]
+
+
+def sequential_world_clock(skill, locations, dtUTC):
+    """World clock entries, from one get_local_datetime() per location."""
+    entries = []
+    for location in locations:
+        dt = skill.get_local_datetime(location, dtUTC)
+        entries.append((location, dt,
+                        nice_time(dt, skill.lang, speech=False,
+                                  use_24hour=skill.use_24hour),
+                        skill._speak_time(dt, bool(location))))
+    return entries
@@ -0,0 +1,257 @@
+# Copyright 2017, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Check that the optimized lookups answer like the plain ones they
+replace, and that the idle clock leaves the faceplate to others.
+"""
+import datetime
+import os
+import sys
+import time
+from collections import OrderedDict
+from os.path import join
+
+import pytz
+from mycroft.messagebus.message import Message
+from mycroft.util.time import now_local, now_utc
+
+from harness import (SKILL_DIR, capture_dialogs, fuzzy_match_queries,
+                     intent_corpus, legacy_best_match, sequential_world_clock,
+                     world_clock_locations)
+
+# Longest a faceplate redraw may take without an answer from the alarm
+# skill, in seconds
+REDRAW_LIMIT = 0.05
+
+# Number of failures shown when a test fails
+SHOWN_FAILURES = 10
+
+
+def report(failures):
+    return "{} failed:\n{}".format(len(failures),
+                                   "\n".join(failures[:SHOWN_FAILURES]))
+
+
+def test_fuzzy_match(skill):
+    """The timezone index matches like scanning every timezone name."""
+    failures = []
+    for query in fuzzy_match_queries():
+        found = skill.timezone_index.best_match(query)
+        expected = legacy_best_match(query)
+        if found != expected:
+            failures.append("{!r}: {} instead of {}".format(query, found,
+                                                            expected))
+    assert not failures, report(failures)
+
+
+def test_offset_tables(skill):
+    """UTC offset table conversions match astimezone().
+
+    For every pytz timezone, moments right before, at and after each DST
+    or other offset transition within the table's window are converted,
+    as well as a moment every week and the ends of the window.
+    """
+    module = sys.modules[type(skill).__module__]
+    failures = []
+    start = datetime.datetime.utcnow() - datetime.timedelta(days=1)
+    end = start + module.OFFSET_TABLE_SPAN
+    week = datetime.timedelta(days=7)
+    second = datetime.timedelta(seconds=1)
+    for zone in pytz.all_timezones:
+        tz = pytz.timezone(zone)
+        table = module.UtcOffsetTable(tz, start)
+        moments = [start, end - second]
+        moment = start
+        while moment < end:
+            moments.append(moment)
+            moment += week
+        for t in getattr(tz, "_utc_transition_times", []):
+            if start + second <= t < end - second:
+                moments += [t - second, t, t + second]
+        for moment in moments:
+            dt = pytz.utc.localize(moment)
+            found = table.convert(dt)
+            expected = dt.astimezone(tz)
+            if (found is None or found.replace(tzinfo=None) !=
+                    expected.replace(tzinfo=None) or
+                    found.utcoffset() != expected.utcoffset() or
+                    found.tzname() != expected.tzname()):
+                failures.append("{} at {}: {} instead of {}".format(
+                    zone, moment, found, expected))
+    assert not failures, report(failures)
+
+
+def test_holidays(skill, corpus):
+    """Holiday lookups match scanning every holiday name.
+
+    The utterances of the corpus and questions about each holiday of years
+    from the past to the future are looked up both ways.  The dialogs
+    spoken for the intent tests are compared too.
+    """
+    module = sys.modules[type(skill).__module__]
+    tables = {}
+
+    def scan(utt, year, day):
+        if year not in tables:
+            tables[year] = module.build_holiday_table("US", year)
+        for name, d in tables[year].items():
+            if name in utt:
+                return day.replace(year=d.year, month=d.month, day=d.day)
+        return day
+
+    failures = []
+    today = now_local()
+    years = [today.year + offset for offset in (-40, -3, 0, 1, 5, 11)]
+    for year in years:
+        utterances = [utt.lower() for _, utt, _ in corpus]
+        utterances += ["when is {} {}".format(name, year)
+                       for name in module.build_holiday_table("US", year)]
+        for utt in utterances:
+            found = skill._find_holiday(utt, year, today)
+            expected = scan(utt, year, today)
+            if found != expected:
+                failures.append("{!r} in {}: {} instead of {}".format(
+                    utt, year, found.date(), expected.date()))
+
+    tests = intent_corpus()
+    answers = capture_dialogs(skill, tests)
+    skill._find_holiday = scan
+    try:
+        expected = capture_dialogs(skill, tests)
+    finally:
+        del skill._find_holiday
+    for (_, utterance, _), got, wanted in zip(tests, answers, expected):
+        if got != wanted:
+            failures.append("{!r}: {} instead of {}".format(utterance, got,
+                                                            wanted))
+    assert not failures, report(failures)
+
+
+def test_alarm_redraw(skill):
+    """Faceplate redraws don't wait for the alarm skill.
+
+    Nothing answers on the local bus, like when the alarm skill isn't
+    installed.  The redraws of a day of clock updates must neither wait
+    for a response nor slow down.
+    """
+    waits = skill.bus.waits
+    durations = []
+    for minute in range(24 * 60):
+        display_time = "{}:{:02d}".format(minute // 60 % 12 or 12,
+                                          minute % 60)
+        start = time.perf_counter()
+        skill.display_mark1(display_time)
+        durations.append(time.perf_counter() - start)
+    assert skill.bus.waits == waits
+    assert max(durations) <= REDRAW_LIMIT
+
+
+def show_idle_clock(skill, monkeypatch):
+    """Pretend the idle clock is on the faceplate, with no alarm set."""
+    monkeypatch.setitem(skill.settings, "show_time", True)
+    monkeypatch.setattr(skill, "answering_query", False)
+    monkeypatch.setattr(skill, "alarm_set", False)
+    monkeypatch.setattr(skill, "displayed_time", "12:34")
+    monkeypatch.setattr(skill, "mark1_frame",
+                        sys.modules[type(skill).__module__].
+                        render_mark1_frame("12:34", False))
+    monkeypatch.setattr(skill.enclosure.display_manager, "active", "")
+    monkeypatch.setattr(skill.enclosure, "calls", [])
+
+
+def report_alarm(skill, active_alarms):
+    skill.bus.emit(Message("private.mycroftai.has_alarm.response",
+                           {"active_alarms": active_alarms}))
+
+
+def mouth_displays(skill):
+    return [call for call in skill.enclosure.calls
+            if call[0] == "mouth_display"]
+
+
+def test_alarm_status_redraws_idle_clock(skill, monkeypatch):
+    """A new alarm puts the alarm dot on the idle clock."""
+    show_idle_clock(skill, monkeypatch)
+    report_alarm(skill, 1)
+    assert len(mouth_displays(skill)) == 1
+    assert skill.enclosure.display_manager.get_active() == ""
+
+
+def test_alarm_status_leaves_busy_faceplate(skill, monkeypatch):
+    """Alarm replies don't draw over another skill's faceplate output."""
+    show_idle_clock(skill, monkeypatch)
+    monkeypatch.setattr(skill.enclosure.display_manager, "active",
+                        "OtherSkill")
+    report_alarm(skill, 1)
+    assert not mouth_displays(skill)
+    assert skill.alarm_set
+
+
+def test_alarm_status_without_show_time(skill, monkeypatch):
+    """Alarm replies don't draw the clock when it isn't wanted."""
+    show_idle_clock(skill, monkeypatch)
+    monkeypatch.setitem(skill.settings, "show_time", False)
+    report_alarm(skill, 1)
+    assert not mouth_displays(skill)
+
+
+def test_timezone_values(skill):
+    """Each timezone.value entry resolves to its own timezone.
+
+    Every entry of every language is looked up the way the table is
+    used, and compared with loading the entry's timezone from pytz.
+    Entries naming no pytz timezone must not be found.
+    """
+    failures = []
+    skill_lang = skill.lang
+    try:
+        for lang in sorted(os.listdir(join(SKILL_DIR, "dialog"))):
+            skill.lang = lang
+            if not skill.find_resource("timezone.value", "dialog"):
+                continue
+            expected = {}
+            for name, zone in skill.translate_namedvalues(
+                    "timezone.value").items():
+                try:
+                    timezone = pytz.timezone(zone.strip())
+                except pytz.UnknownTimeZoneError:
+                    timezone = None
+                expected.setdefault(name.lower(), timezone)
+            for name, timezone in expected.items():
+                found = skill._get_timezone_from_table(name)
+                if found != timezone:
+                    failures.append("{} {!r}: {} instead of {}".format(
+                        lang, name, found, timezone))
+    finally:
+        skill.lang = skill_lang
+    assert not failures, report(failures)
+
+
+def test_world_clock(skill):
+    """The world clock matches one lookup per location."""
+    failures = []
+    locations = world_clock_locations(100) + [None]
+    dtUTC = now_utc()
+    expected = OrderedDict()
+    for entry in sequential_world_clock(skill, locations, dtUTC):
+        expected.setdefault(entry[0], entry)
+    batch = skill.get_local_datetimes(locations, dtUTC)
+    assert list(batch) == list(expected)
+    for entry in skill.get_world_clock(locations, dtUTC):
+        wanted = expected.get(entry.location)
+        got = (entry.location, entry.datetime, entry.display_time,
+               entry.spoken_time)
+        if got != wanted or batch.get(entry.location) != entry.datetime:
+            failures.append("{}: {} instead of {}".format(entry.location,
+                                                          got, wanted))
+    assert not failures, report(failures)
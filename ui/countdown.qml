@@ -0,0 +1,47 @@
+import QtQuick.Layouts 1.4
+import QtQuick 2.4
+import QtQuick.Controls 2.0
+import org.kde.kirigami 2.4 as Kirigami
+
+import Mycroft 1.0 as Mycroft
+
+Mycroft.Delegate {
+    ListView {
+        id: countdown
+        anchors.fill: parent
+        spacing: Kirigami.Units.largeSpacing
+        model: sessionData.countdown
+        delegate: RowLayout {
+            width: countdown.width
+            Label {
+                Layout.preferredWidth: Kirigami.Units.gridUnit * 5
+                horizontalAlignment: Text.AlignRight
+                font.pixelSize: 50
+                font.family: "Noto Sans Display"
+                font.bold: true
+                text: modelData.days
+                color: "white"
+            }
+            ColumnLayout {
+                Layout.fillWidth: true
+                spacing: 0
+                Label {
+                    Layout.fillWidth: true
+                    font.pixelSize: 30
+                    elide: Text.ElideRight
+                    font.family: "Noto Sans Display"
+                    font.bold: true
+                    text: modelData.holiday
+                    color: "white"
+                }
+                Label {
+                    Layout.fillWidth: true
+                    font.pixelSize: 20
+                    font.family: "Noto Sans Display"
+                    text: modelData.date
+                    color: "white"
+                }
+            }
+        }
+    }
+}
@@ -55,5 +55,17 @@ Mycroft.Delegate {
             text: sessionData.month_string
             color: "white"
         }
+        Item {
+            height: Kirigami.Units.largeSpacing * 3
+        }
+        Label {
+            id: daylight
+            Layout.alignment: Qt.AlignCenter
+            visible: sessionData.daytime === true || sessionData.daytime === false
+            font.pixelSize: 50
+            font.family: "Noto Sans Display"
+            text: sessionData.daytime ? "☀" : "☾"
+            color: "white"
+        }
     }
 }